@@ -0,0 +1,73 @@
+"""case-insensitive user email
+
+Revision ID: 3f9a1c7d2b64
+Revises: 86169c575567
+Create Date: 2026-10-18 10:12:31.402118
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a1c7d2b64'
+down_revision: Union[str, Sequence[str], None] = '86169c575567'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not context.is_offline_mode():
+        check_case_duplicates()
+        drop_invalid_index()
+    # build the index without locking out writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'edu_users_email_lower_key',
+            'edu_users',
+            [sa.text('lower(email)')],
+            unique=True,
+            schema='edu_core',
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+    op.drop_constraint(op.f('edu_users_email_key'), 'edu_users', schema='edu_core', type_='unique')
+    # store emails the way the API now normalizes them
+    op.execute("UPDATE edu_core.edu_users SET email = lower(email) WHERE email <> lower(email)")
+
+
+def check_case_duplicates() -> None:
+    """Fail with the offending emails instead of midway through the index build."""
+    duplicates = op.get_bind().execute(sa.text(
+        "SELECT lower(email) FROM edu_core.edu_users GROUP BY lower(email) HAVING count(*) > 1 ORDER BY 1 LIMIT 20"
+    )).scalars().all()
+    if duplicates:
+        raise Exception(
+            "Emails must be unique ignoring case; merge or rename the users sharing these emails first: "
+            + ", ".join(duplicates)
+        )
+
+
+def drop_invalid_index() -> None:
+    """Drop the INVALID index a failed concurrent build leaves behind, so the migration can be retried."""
+    invalid = op.get_bind().execute(sa.text(
+        "SELECT 1 FROM pg_index WHERE indexrelid = to_regclass('edu_core.edu_users_email_lower_key') AND NOT indisvalid"
+    )).first()
+    if invalid:
+        with op.get_context().autocommit_block():
+            op.drop_index('edu_users_email_lower_key', table_name='edu_users', schema='edu_core', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_unique_constraint(op.f('edu_users_email_key'), 'edu_users', ['email'], schema='edu_core')
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'edu_users_email_lower_key',
+            table_name='edu_users',
+            schema='edu_core',
+            postgresql_concurrently=True,
+        )
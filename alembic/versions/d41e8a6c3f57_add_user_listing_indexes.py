@@ -0,0 +1,66 @@
+"""add user listing indexes
+
+Revision ID: d41e8a6c3f57
+Revises: b9d27f4e6a18
+Create Date: 2026-10-18 14:31:47.120553
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41e8a6c3f57'
+down_revision: Union[str, Sequence[str], None] = 'b9d27f4e6a18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = ('edu_users_created_at_id_idx', 'edu_users_email_lower_pattern_idx')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not context.is_offline_mode():
+        for index_name in INDEXES:
+            drop_invalid_index(index_name)
+    # built concurrently so a large user table stays writable meanwhile
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'edu_users_created_at_id_idx',
+            'edu_users',
+            ['created_at', 'id'],
+            unique=False,
+            schema='edu_core',
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'edu_users_email_lower_pattern_idx',
+            'edu_users',
+            [sa.text('lower(email) text_pattern_ops')],
+            unique=False,
+            schema='edu_core',
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def drop_invalid_index(index_name: str) -> None:
+    """Drop the INVALID index a failed concurrent build leaves behind, so the migration can be retried."""
+    invalid = op.get_bind().execute(
+        sa.text("SELECT 1 FROM pg_index WHERE indexrelid = to_regclass(:name) AND NOT indisvalid"),
+        {"name": f"edu_core.{index_name}"},
+    ).first()
+    if invalid:
+        with op.get_context().autocommit_block():
+            op.drop_index(index_name, table_name='edu_users', schema='edu_core', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for index_name in reversed(INDEXES):
+            op.drop_index(index_name, table_name='edu_users', schema='edu_core', postgresql_concurrently=True)
@@ -0,0 +1,45 @@
+"""add updated_at trigger
+
+Revision ID: f2c81d5a7e93
+Revises: d41e8a6c3f57
+Create Date: 2026-10-18 16:12:05.482317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c81d5a7e93'
+down_revision: Union[str, Sequence[str], None] = 'd41e8a6c3f57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # keeps updated_at current for every UPDATE, including raw SQL; an UPDATE
+    # that sets updated_at itself (e.g. a backfill) is left alone
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION edu_core.set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.updated_at IS NOT DISTINCT FROM OLD.updated_at THEN
+                NEW.updated_at := timezone('utc', now());
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER edu_users_set_updated_at BEFORE UPDATE ON edu_core.edu_users "
+        "FOR EACH ROW EXECUTE FUNCTION edu_core.set_updated_at()"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS edu_users_set_updated_at ON edu_core.edu_users")
+    op.execute("DROP FUNCTION IF EXISTS edu_core.set_updated_at()")
@@ -0,0 +1,77 @@
+"""Sustained ingest rate of the buffered audit log writer.
+
+Producers record login events as fast as the event loop lets them for a
+fixed duration while the writer COPYs batches into ``edu_auth_events`` on
+the configured database. Reports events offered, written and dropped per
+second. The rows are deleted afterwards::
+
+    uv run python -m benchmarks.audit_ingest --duration 10 --producers 64
+"""
+import asyncio
+import json
+import time
+
+import click
+from sqlalchemy import delete
+
+from src.auth.audit import AuditLogWriter
+from src.auth.models import EduAuthEvent
+from src.database.core import get_session_manager
+
+EMAIL = "bench-audit@example.com"
+
+
+async def run(duration: float, producers: int, flush_size: int, flush_interval: float, policy: str) -> dict:
+    session_manager = get_session_manager()
+    await session_manager.startup()
+    writer = AuditLogWriter(
+        buffer_size=flush_size * 50,
+        flush_size=flush_size,
+        flush_interval=flush_interval,
+        overflow_policy=policy,
+        block_timeout=1.0,
+    )
+    offered = 0
+
+    async def produce(deadline: float) -> None:
+        nonlocal offered
+        while time.perf_counter() < deadline:
+            await writer.record("login", email=EMAIL, ip_address="127.0.0.1", success=True)
+            offered += 1
+            await asyncio.sleep(0)  # interleave like concurrent requests
+
+    try:
+        writer.start(session_manager)
+        start = time.perf_counter()
+        await asyncio.gather(*(produce(start + duration) for _ in range(producers)))
+        await writer.stop()
+        elapsed = time.perf_counter() - start
+
+        async with session_manager.connect() as conn:
+            await conn.execute(delete(EduAuthEvent).where(EduAuthEvent.email == EMAIL))
+    finally:
+        await session_manager.close()
+
+    return {
+        "seconds": round(elapsed, 2),
+        "offered_per_second": round(offered / elapsed, 1),
+        "written_per_second": round(writer.written / elapsed, 1),
+        "written": writer.written,
+        "dropped": writer.dropped,
+    }
+
+
+@click.command()
+@click.option("--duration", default=10.0, show_default=True, help="Seconds to produce events.")
+@click.option("--producers", default=64, show_default=True, help="Concurrent producer tasks.")
+@click.option("--flush-size", default=1000, show_default=True)
+@click.option("--flush-interval", default=0.5, show_default=True)
+@click.option("--policy", type=click.Choice(["block", "drop_newest", "drop_oldest"]), default="block", show_default=True)
+def main(duration: float, producers: int, flush_size: int, flush_interval: float, policy: str):
+    """Measure audit events written per second and print a JSON report."""
+    report = asyncio.run(run(duration, producers, flush_size, flush_interval, policy))
+    click.echo(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""End-to-end load benchmark for the auth API.
+
+Drives ``src.main:app`` in-process through an ASGI transport by default, or a
+real server with ``--uvicorn`` (spawned here) or ``--url`` (already running).
+Results are written as JSON so runs can be diffed between rollouts::
+
+    uv run --group bench python -m benchmarks.auth_load --concurrency 32 --requests 2000
+"""
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager
+
+import click
+import httpx
+
+SCENARIOS = ("health", "register", "login", "me")
+PASSWORD = "Bench-password-123"
+
+# throttling would turn a load test into a 429 test
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies: list[float], statuses: Counter, wall_time: float) -> dict:
+    latencies.sort()
+    ms = [latency * 1000 for latency in latencies]
+    ok = sum(count for status, count in statuses.items() if 200 <= status < 300)
+    return {
+        "requests": len(latencies),
+        "errors": len(latencies) - ok,
+        "status_codes": {str(status): count for status, count in sorted(statuses.items())},
+        "wall_time_s": round(wall_time, 3),
+        "throughput_rps": round(len(latencies) / wall_time, 1) if wall_time else 0.0,
+        "latency_ms": {
+            "mean": round(statistics.fmean(ms), 3) if ms else 0.0,
+            "p50": round(percentile(ms, 50), 3),
+            "p95": round(percentile(ms, 95), 3),
+            "p99": round(percentile(ms, 99), 3),
+            "max": round(ms[-1], 3) if ms else 0.0,
+        },
+    }
+
+
+async def run_scenario(
+    request: Callable[[int], Awaitable[httpx.Response]], *, requests: int, concurrency: int
+) -> dict:
+    """Issue ``requests`` calls from ``concurrency`` workers and summarize them."""
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    counter = iter(range(requests))
+
+    async def worker() -> None:
+        for i in counter:
+            start = time.perf_counter()
+            try:
+                response = await request(i)
+                statuses[response.status_code] += 1
+            except httpx.HTTPError:
+                statuses[0] += 1
+            latencies.append(time.perf_counter() - start)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, statuses, time.perf_counter() - started)
+
+
+def build_requests(client: httpx.AsyncClient, run_id: str, cookie: str) -> dict[str, Callable]:
+    login_body = {"email": f"bench-{run_id}@example.com", "password": PASSWORD}
+
+    return {
+        "health": lambda i: client.get("/api/v1/health"),
+        "register": lambda i: client.post(
+            "/api/v1/auth/register",
+            json={"email": f"bench-{run_id}-{i}@example.com", "password": PASSWORD},
+        ),
+        "login": lambda i: client.post("/api/v1/auth/login", json=login_body),
+        "me": lambda i: client.get("/api/v1/auth/me", cookies={"access_token": cookie}),
+    }
+
+
+async def prepare_user(client: httpx.AsyncClient, run_id: str) -> str:
+    """Register the account used by login/me and return its access token."""
+    body = {"email": f"bench-{run_id}@example.com", "password": PASSWORD}
+    response = await client.post("/api/v1/auth/register", json=body)
+    response.raise_for_status()
+    response = await client.post("/api/v1/auth/login", json=body)
+    response.raise_for_status()
+    return response.cookies["access_token"]
+
+
+async def delete_bench_users(run_id: str) -> int:
+    """Delete the users this run registered, and their audit events; sessions cascade."""
+    from sqlalchemy import delete
+
+    from src.auth.models import EduAuthEvent, EduUser
+    from src.config import settings
+    from src.database.core import DatabaseSessionManager
+
+    # a manager of its own, the app's may be closed already or live in another process
+    session_manager = DatabaseSessionManager(host=str(settings.DATABASE_ASYNC_URL), engine_kwargs={})
+    try:
+        async with session_manager.connect() as conn:
+            await conn.execute(delete(EduAuthEvent).where(EduAuthEvent.email.startswith(f"bench-{run_id}")))
+            result = await conn.execute(delete(EduUser).where(EduUser.email.startswith(f"bench-{run_id}")))
+        return result.rowcount
+    finally:
+        await session_manager.close()
+
+
+@asynccontextmanager
+async def in_process_client():
+    # imported late so the environment overrides above apply to settings
+    from src.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            yield client
+
+
+@asynccontextmanager
+async def http_client(url: str, concurrency: int):
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30) as client:
+        yield client
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_server(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{url}/api/v1/health").status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise click.ClickException(f"Server at {url} did not become healthy")
+
+
+async def benchmark(
+    *, url: str | None, scenarios: tuple[str, ...], requests: int, concurrency: int
+) -> dict:
+    run_id = uuid.uuid4().hex[:12]
+    client_factory = http_client(url, concurrency) if url else in_process_client()
+    results = {}
+    try:
+        async with client_factory as client:
+            cookie = await prepare_user(client, run_id)
+            calls = build_requests(client, run_id, cookie)
+            for name in scenarios:
+                results[name] = await run_scenario(calls[name], requests=requests, concurrency=concurrency)
+                summary = results[name]
+                click.echo(f"{name}: {summary['throughput_rps']} req/s, p99 {summary['latency_ms']['p99']} ms", err=True)
+    finally:
+        deleted = await delete_bench_users(run_id)
+        click.echo(f"cleanup: deleted {deleted} bench users", err=True)
+    return results
+
+
+def environment_info() -> dict:
+    from src.config import settings
+
+    keys = (
+        "DATABASE_POOL_SIZE",
+        "BCRYPT_ROUNDS",
+        "HASHING_EXECUTOR",
+        "HASHING_WORKERS",
+        "HASHING_MAX_PENDING",
+    )
+    return {key.lower(): getattr(settings, key) for key in keys}
+
+
+@click.command()
+@click.option(
+    "--scenario",
+    "scenarios",
+    type=click.Choice(SCENARIOS),
+    multiple=True,
+    help="Scenario to run, repeatable. Runs all by default.",
+)
+@click.option("--requests", default=1000, show_default=True, help="Requests per scenario.")
+@click.option("--concurrency", default=16, show_default=True, help="Concurrent clients.")
+@click.option("--url", default=None, help="Benchmark an already running server instead of the in-process app.")
+@click.option("--uvicorn", "uvicorn_workers", type=int, default=None, help="Spawn uvicorn with this many workers.")
+@click.option("--output", type=click.File("w"), default="-", help="Where to write the JSON report.")
+def main(
+    scenarios: tuple[str, ...],
+    requests: int,
+    concurrency: int,
+    url: str | None,
+    uvicorn_workers: int | None,
+    output,
+):
+    """Run the auth API load benchmark and print a JSON report."""
+    scenarios = scenarios or SCENARIOS
+    server = None
+    mode = "url" if url else "asgi"
+    if uvicorn_workers:
+        port = free_port()
+        url = f"http://127.0.0.1:{port}"
+        mode = "uvicorn"
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "src.main:app", "--port", str(port), "--workers", str(uvicorn_workers)],
+            env=os.environ.copy(),
+        )
+        wait_for_server(url)
+
+    try:
+        results = asyncio.run(
+            benchmark(url=url, scenarios=scenarios, requests=requests, concurrency=concurrency)
+        )
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    report = {
+        "mode": mode,
+        "url": url,
+        "workers": uvicorn_workers,
+        "concurrency": concurrency,
+        "requests_per_scenario": requests,
+        "settings": environment_info(),
+        "scenarios": results,
+    }
+    json.dump(report, output, indent=2)
+    output.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Micro-benchmark: ORM entity lookup vs the lean auth query path.
+
+Runs both lookups for the same email against the configured database and
+reports wall and CPU time per call. The seeded user is deleted afterwards::
+
+    uv run python -m benchmarks.auth_queries --iterations 5000
+"""
+import asyncio
+import json
+import time
+
+import click
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert
+
+from src.auth.models import EduUser
+from src.auth.queries import fetch_record_by_email
+from src.auth.services import get_by_email
+from src.database.core import get_session_manager
+
+EMAIL = "bench-queries@example.com"
+
+
+async def measure(lookup, iterations: int) -> dict:
+    async with get_session_manager().session() as db_session:
+        # warm up the pool, compiled cache and prepared statements
+        for _ in range(50):
+            await lookup(db_session)
+            db_session.expunge_all()
+
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        for _ in range(iterations):
+            await lookup(db_session)
+            # keep the identity map from turning ORM lookups into cache hits
+            db_session.expunge_all()
+        wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+    return {
+        "iterations": iterations,
+        "wall_us_per_call": round(wall / iterations * 1e6, 2),
+        "cpu_us_per_call": round(cpu / iterations * 1e6, 2),
+        "calls_per_second": round(iterations / wall, 1),
+    }
+
+
+async def run(iterations: int) -> dict:
+    await get_session_manager().startup()
+    try:
+        async with get_session_manager().session() as db_session:
+            await db_session.execute(
+                insert(EduUser).values(email=EMAIL, password=b"not-a-real-hash").on_conflict_do_nothing()
+            )
+            await db_session.commit()
+
+        orm = await measure(lambda s: get_by_email(db_session=s, email=EMAIL), iterations)
+        lean = await measure(lambda s: fetch_record_by_email(db_session=s, email=EMAIL), iterations)
+    finally:
+        try:
+            async with get_session_manager().connect() as conn:
+                await conn.execute(delete(EduUser).where(EduUser.email == EMAIL))
+        finally:
+            await get_session_manager().close()
+
+    return {
+        "orm": orm,
+        "lean": lean,
+        "cpu_saving_pct": round((1 - lean["cpu_us_per_call"] / orm["cpu_us_per_call"]) * 100, 1),
+    }
+
+
+@click.command()
+@click.option("--iterations", default=5000, show_default=True, help="Lookups per path.")
+def main(iterations: int):
+    """Compare the ORM and lean lookup paths and print a JSON report."""
+    click.echo(json.dumps(asyncio.run(run(iterations)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Check that email lookups are served by the lower(email) index.
+
+Seeds a large number of users inside a transaction, refreshes planner
+statistics, and inspects ``EXPLAIN`` for each lookup statement. Everything
+is rolled back afterwards; exits non-zero if any lookup misses the index or
+does a sequential scan::
+
+    uv run python -m benchmarks.email_index --rows 200000
+"""
+import asyncio
+import json
+
+import click
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects import postgresql
+
+from src.auth.models import EduUser
+from src.auth.queries import select_record_by_email
+from src.constants import DB_SCHEMA
+from src.database.core import get_session_manager
+
+# the unique index, or the text_pattern_ops one for prefix search, which serves equality too
+LOWER_EMAIL_INDEXES = {"edu_users_email_lower_key", "edu_users_email_lower_pattern_idx"}
+EMAIL = "seed-4242@example.com"
+
+LOOKUPS = {
+    "fetch_record_by_email": select_record_by_email.params(email=EMAIL),
+    "get_by_email": select(EduUser).where(func.lower(EduUser.email) == EMAIL),
+}
+
+
+def plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+async def run(rows: int) -> dict:
+    dialect = postgresql.dialect()
+    session_manager = get_session_manager()
+    report = {}
+    try:
+        async with session_manager.session() as db_session:
+            await db_session.execute(
+                text(
+                    f"INSERT INTO {DB_SCHEMA}.edu_users (email, password) "
+                    "SELECT 'Seed-' || g || '@Example.com', '\\x00'::bytea "
+                    "FROM generate_series(1, :rows) AS g ON CONFLICT DO NOTHING"
+                ),
+                {"rows": rows},
+            )
+            await db_session.execute(text(f"ANALYZE {DB_SCHEMA}.edu_users"))
+
+            for name, statement in LOOKUPS.items():
+                sql = statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+                result = await db_session.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+                plan = result.scalar_one()[0]["Plan"]
+                nodes = [(node["Node Type"], node.get("Index Name")) for node in plan_nodes(plan)]
+                report[name] = {
+                    "uses_index": any(index in LOWER_EMAIL_INDEXES for _, index in nodes),
+                    "seq_scan": any(node_type == "Seq Scan" for node_type, _ in nodes),
+                    "plan": [node_type if index is None else f"{node_type} using {index}" for node_type, index in nodes],
+                }
+            await db_session.rollback()
+    finally:
+        await session_manager.close()
+    return report
+
+
+@click.command()
+@click.option("--rows", default=200_000, show_default=True, help="Users to seed before planning.")
+def main(rows: int):
+    """EXPLAIN the email lookups on a seeded table and fail on sequential scans."""
+    report = asyncio.run(run(rows))
+    click.echo(json.dumps(report, indent=2))
+    if not all(lookup["uses_index"] and not lookup["seq_scan"] for lookup in report.values()):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
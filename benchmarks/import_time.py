@@ -0,0 +1,56 @@
+"""Guard against import-time regressions.
+
+Imports each module in a fresh interpreter with ``-X importtime`` and fails
+when it exceeds its time budget. That no heavy dependency or the settings
+load on import is checked by ``tests/test_import_time.py``::
+
+    uv run python -m benchmarks.import_time
+"""
+import json
+import os
+import subprocess
+import sys
+
+import click
+
+# module -> cumulative import budget in ms
+BUDGETS: dict[str, float] = {
+    "src.cli": 150.0,
+    "src.database.core": 1000.0,
+}
+
+
+def measure(module: str) -> float:
+    """Import ``module`` in a subprocess and return its cumulative import time in ms."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative) / 1000
+    raise Exception(f"No import time reported for {module}")
+
+
+@click.command()
+@click.option("--budget-scale", default=1.0, show_default=True, help="Multiply every budget, e.g. on slow CI hosts.")
+def main(budget_scale: float):
+    """Check import times against their budgets, printing a JSON report."""
+    report, failed = {}, False
+    for module, budget_ms in BUDGETS.items():
+        elapsed_ms = measure(module)
+        failed |= elapsed_ms > budget_ms * budget_scale
+        report[module] = {"import_ms": round(elapsed_ms, 1), "budget_ms": budget_ms * budget_scale}
+    click.echo(json.dumps(report, indent=2))
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
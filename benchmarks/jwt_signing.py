@@ -0,0 +1,61 @@
+"""Access token mint and verify throughput by signing setup.
+
+Compares the HS256 path as it used to be called (shared secret string),
+and RS256 with the PEM passed on every call against the cached key
+objects used by ``src.auth.keys``. Needs no database; generates a
+throwaway RSA key::
+
+    uv run python -m benchmarks.jwt_signing --iterations 2000
+"""
+import json
+import time
+from collections.abc import Callable
+
+import click
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+CLAIMS = {"email": "bench@example.com", "exp": time.time() + 3600, "jti": "bench"}
+
+
+def rate(func: Callable[[], object], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return round(iterations / (time.perf_counter() - start), 1)
+
+
+def measure(sign_key, verify_key, algorithm: str, iterations: int) -> dict:
+    token = jwt.encode(CLAIMS, sign_key, algorithm=algorithm)
+    return {
+        "mint_per_second": rate(lambda: jwt.encode(CLAIMS, sign_key, algorithm=algorithm), iterations),
+        "verify_per_second": rate(lambda: jwt.decode(token, verify_key, algorithms=[algorithm]), iterations),
+    }
+
+
+@click.command()
+@click.option("--iterations", default=2000, show_default=True, help="Operations per measurement.")
+def main(iterations: int):
+    """Print mint/verify rates for each signing setup as JSON."""
+    secret = "bench-secret-bench-secret-bench-secret"
+    private = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+    public_pem = private.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+    rsa_key = jwk.construct(private_pem, "RS256")
+
+    report = {
+        "hs256_secret": measure(secret, secret, "HS256", iterations),
+        "hs256_cached_key": measure(jwk.construct(secret, "HS256"), jwk.construct(secret, "HS256"), "HS256", iterations),
+        "rs256_pem": measure(private_pem, public_pem, "RS256", iterations),
+        "rs256_cached_key": measure(rsa_key, rsa_key.public_key(), "RS256", iterations),
+    }
+    click.echo(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
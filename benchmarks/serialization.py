@@ -0,0 +1,77 @@
+"""Serialization cost per response: stock JSONResponse vs ORJSONResponse.
+
+Mirrors what FastAPI does for a route with a ``response_model``: dump the
+model in JSON mode, then render the body with the response class. Runs
+without a database::
+
+    uv run python -m benchmarks.serialization
+"""
+import json
+import time
+from datetime import datetime, timedelta
+
+import click
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import TypeAdapter
+
+from src.auth.schemas import UserLoginResponse
+from src.schemas import EduBase, EduDateTime
+
+
+class UserListItem(EduBase):
+    """Shape of a row in a user listing response."""
+
+    id: int
+    email: str
+    created_at: EduDateTime
+
+
+def payloads() -> dict[str, tuple[TypeAdapter, object]]:
+    now = datetime(2025, 1, 1)
+    items = [
+        UserListItem(id=i, email=f"user{i}@example.com", created_at=now + timedelta(seconds=i))
+        for i in range(1000)
+    ]
+    return {
+        "login_response": (
+            TypeAdapter(UserLoginResponse),
+            UserLoginResponse(email="user@example.com", message="Login successful"),
+        ),
+        "user_list_100": (TypeAdapter(list[UserListItem]), items[:100]),
+        "user_list_1000": (TypeAdapter(list[UserListItem]), items),
+    }
+
+
+def time_per_call(func, iterations: int) -> float:
+    """Microseconds per call."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+@click.command()
+@click.option("--iterations", default=2000, show_default=True, help="Renders per payload and response class.")
+def main(iterations: int):
+    """Print serialization cost per response as JSON."""
+    report = {}
+    for name, (adapter, value) in payloads().items():
+        content = adapter.dump_python(value, mode="json")
+        # scale iterations down with payload size to keep run time flat
+        n = max(20, iterations // (len(content) if isinstance(content, list) else 1))
+        dump_us = time_per_call(lambda: adapter.dump_python(value, mode="json"), n)
+        stock_us = time_per_call(lambda: JSONResponse(content), n)
+        orjson_us = time_per_call(lambda: ORJSONResponse(content), n)
+        assert json.loads(JSONResponse(content).body) == json.loads(ORJSONResponse(content).body)
+        report[name] = {
+            "iterations": n,
+            "model_dump_us": round(dump_us, 2),
+            "json_response_us": round(dump_us + stock_us, 2),
+            "orjson_response_us": round(dump_us + orjson_us, 2),
+            "render_speedup": round(stock_us / orjson_us, 2),
+        }
+    click.echo(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from src.auth.routes import auth_router
@@ -17,7 +17,7 @@ class ErrorResponse(BaseModel):
 
 
 api_router = APIRouter(
-    default_response_class=JSONResponse,
+    default_response_class=ORJSONResponse,
     responses={
         400: {"model": ErrorResponse},
         401: {"model": ErrorResponse},
@@ -0,0 +1,177 @@
+"""Buffered writer for the authentication audit trail.
+
+Handlers hand events to ``audit_log.record`` and continue; a single flusher
+task started in the lifespan COPYs them into ``edu_auth_events`` every
+``AUDIT_FLUSH_INTERVAL`` seconds, or as soon as ``AUDIT_FLUSH_SIZE`` events
+are waiting. Only one flush runs at a time, so when the database is slow
+batches simply grow. Past ``AUDIT_BUFFER_SIZE`` buffered events the
+``AUDIT_OVERFLOW_POLICY`` applies:
+
+- ``block``: the caller waits up to ``AUDIT_BLOCK_TIMEOUT`` for space
+  (backpressure onto the request), then the event is dropped;
+- ``drop_newest``: the new event is dropped;
+- ``drop_oldest``: the oldest buffered event makes room for it.
+
+Dropped events are logged and counted in ``audit_events_total``.
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Literal, NamedTuple
+
+from src.config import settings
+from src.constants import DB_SCHEMA
+from src.database.core import DatabaseSessionManager
+from src.metrics import AUDIT_BUFFERED, AUDIT_EVENTS, AUDIT_FLUSH_DURATION
+
+logger = logging.getLogger(__name__)
+
+OverflowPolicy = Literal["block", "drop_newest", "drop_oldest"]
+
+COLUMNS = ["event", "email", "ip_address", "success", "occurred_at"]
+
+
+class AuthEvent(NamedTuple):
+    event: str
+    email: str
+    ip_address: str
+    success: bool
+    occurred_at: datetime
+
+
+class AuditLogWriter:
+    def __init__(
+        self,
+        *,
+        buffer_size: int,
+        flush_size: int,
+        flush_interval: float,
+        overflow_policy: OverflowPolicy,
+        block_timeout: float,
+    ) -> None:
+        self._buffer: deque[AuthEvent] = deque()
+        self._buffer_size = buffer_size
+        self._flush_size = flush_size
+        self._flush_interval = flush_interval
+        self._overflow_policy = overflow_policy
+        self._block_timeout = block_timeout
+        self._flush_wanted = asyncio.Event()
+        self._space_freed = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = False
+        self._session_manager: DatabaseSessionManager | None = None
+        self.written = 0
+        self.dropped = 0
+
+    @property
+    def buffered(self) -> int:
+        return len(self._buffer)
+
+    async def record(self, event: str, *, email: str, ip_address: str, success: bool) -> None:
+        """Buffer an event without waiting for the database; only ``block`` waits, for buffer space."""
+        entry = AuthEvent(event, email, ip_address, success, datetime.now(timezone.utc).replace(tzinfo=None))
+
+        if len(self._buffer) >= self._buffer_size:
+            if self._overflow_policy == "drop_oldest":
+                self._buffer.popleft()
+                self._drop(1)
+            elif self._overflow_policy == "block" and await self._wait_for_space():
+                pass
+            else:
+                self._drop(1)
+                return
+
+        self._buffer.append(entry)
+        AUDIT_BUFFERED.set(len(self._buffer))
+        if len(self._buffer) >= self._flush_size:
+            self._flush_wanted.set()
+
+    async def _wait_for_space(self) -> bool:
+        deadline = time.monotonic() + self._block_timeout
+        while len(self._buffer) >= self._buffer_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self._space_freed.clear()
+            try:
+                await asyncio.wait_for(self._space_freed.wait(), remaining)
+            except TimeoutError:
+                return False
+        return True
+
+    def _drop(self, count: int) -> None:
+        if not self.dropped:
+            logger.warning("Audit buffer is full, dropping events")
+        self.dropped += count
+        AUDIT_EVENTS.labels("dropped").inc(count)
+
+    def start(self, session_manager: DatabaseSessionManager) -> None:
+        self._session_manager = session_manager
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flusher once it has written whatever is still buffered."""
+        if self._task is None:
+            return
+        # not cancelled: that could lose a batch in the middle of its COPY
+        self._stopping = True
+        self._flush_wanted.set()
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._flush_wanted.wait(), self._flush_interval)
+            except TimeoutError:
+                pass
+            self._flush_wanted.clear()
+            if self._buffer and not await self.flush():
+                # back off so a failing database isn't hammered; events stay buffered
+                await asyncio.sleep(self._flush_interval)
+        if self._buffer:
+            await self.flush()
+
+    async def flush(self) -> bool:
+        """Write the buffered events with a single COPY; False if the write failed."""
+        assert self._session_manager is not None
+        batch = list(self._buffer)
+        self._buffer.clear()
+        self._space_freed.set()
+        AUDIT_BUFFERED.set(0)
+
+        start = time.perf_counter()
+        try:
+            async with self._session_manager.connect() as conn:
+                raw_connection = await conn.get_raw_connection()
+                await raw_connection.driver_connection.copy_records_to_table(
+                    "edu_auth_events", schema_name=DB_SCHEMA, records=batch, columns=COLUMNS
+                )
+        except Exception:
+            logger.exception(f"Failed to write {len(batch)} audit events")
+            # put the batch back in front of newer events, as far as the buffer allows
+            room = max(0, self._buffer_size - len(self._buffer))
+            kept = batch[-room:] if room else []
+            self._buffer.extendleft(reversed(kept))
+            if len(kept) < len(batch):
+                self._drop(len(batch) - len(kept))
+            AUDIT_BUFFERED.set(len(self._buffer))
+            return False
+        finally:
+            AUDIT_FLUSH_DURATION.observe(time.perf_counter() - start)
+
+        self.written += len(batch)
+        AUDIT_EVENTS.labels("written").inc(len(batch))
+        return True
+
+
+audit_log: AuditLogWriter = AuditLogWriter(
+    buffer_size=settings.AUDIT_BUFFER_SIZE,
+    flush_size=settings.AUDIT_FLUSH_SIZE,
+    flush_interval=settings.AUDIT_FLUSH_INTERVAL,
+    overflow_policy=settings.AUDIT_OVERFLOW_POLICY,
+    block_timeout=settings.AUDIT_BLOCK_TIMEOUT,
+)
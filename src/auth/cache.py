@@ -0,0 +1,88 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+
+from src.auth.models import UserRecord
+from src.config import settings
+
+
+class UserCache:
+    """Per-process TTL/LRU cache of user records keyed by email.
+
+    Concurrent misses for the same email share one in-flight load
+    (single-flight), so a burst on a hot account costs a single query.
+    Only found users are cached; lookups for unknown emails always reach
+    the loader, which keeps fresh registrations visible on every worker.
+
+    Records include the password hash. A password change invalidates the
+    entry on the worker that made it, but other workers keep accepting the
+    old password until their entry expires, for up to ``USER_CACHE_TTL``
+    seconds.
+    """
+
+    def __init__(self, *, maxsize: int, ttl: float) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, UserRecord]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[UserRecord | None]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, email: str, loader: Callable[[], Awaitable[UserRecord | None]]) -> UserRecord | None:
+        entry = self._entries.get(email)
+        if entry is not None:
+            expires_at, record = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(email)
+                self.hits += 1
+                return record
+            del self._entries[email]
+
+        self.misses += 1
+        task = self._inflight.get(email)
+        if task is None:
+            task = asyncio.ensure_future(loader())
+            self._inflight[email] = task
+            task.add_done_callback(lambda t: self._on_loaded(email, t))
+        else:
+            self.coalesced += 1
+        # shield so one cancelled caller doesn't fail the others waiting on the load
+        return await asyncio.shield(task)
+
+    def _on_loaded(self, email: str, task: asyncio.Task[UserRecord | None]) -> None:
+        # an invalidation during the load drops the task, so its result is stale
+        if self._inflight.get(email) is not task:
+            return
+        del self._inflight[email]
+        if task.cancelled() or task.exception() is not None:
+            return
+        record = task.result()
+        if record is not None:
+            self._entries[email] = (time.monotonic() + self._ttl, record)
+            self._entries.move_to_end(email)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, email: str) -> None:
+        self._entries.pop(email, None)
+        self._inflight.pop(email, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._inflight.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+        }
+
+
+user_cache: UserCache = UserCache(maxsize=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL)
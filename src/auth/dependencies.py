@@ -0,0 +1,59 @@
+from typing import Annotated, Any
+
+from fastapi import Cookie, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.models import EduUser
+from src.auth.revocation import revocation_list
+from src.auth.services import get_by_email
+from src.auth.tokens import decode_access_token
+from src.database.dependencies import DBSession
+from src.config import settings
+from src.exceptions import NotAuthenticated, PermissionDenied
+
+
+class AuthenticatedUser:
+    """The caller identified by the access token cookie.
+
+    Only the token claims are available up front; the ``EduUser`` row is
+    loaded on first call to ``get_user`` so email-only routes skip the database.
+    """
+
+    __slots__ = ("email", "claims", "_db_session", "_user")
+
+    def __init__(self, *, claims: dict[str, Any], db_session: AsyncSession) -> None:
+        self.email: str = claims["email"]
+        self.claims = claims
+        self._db_session = db_session
+        self._user: EduUser | None = None
+
+    async def get_user(self) -> EduUser:
+        """Load the user row, raising NotAuthenticated if it no longer exists."""
+        if self._user is None:
+            self._user = await get_by_email(db_session=self._db_session, email=self.email)
+            if self._user is None:
+                raise NotAuthenticated()
+        return self._user
+
+
+async def get_current_user(
+    db_session: DBSession,
+    access_token: Annotated[str | None, Cookie()] = None,
+) -> AuthenticatedUser:
+    """Authenticate the request from the access_token cookie set by login."""
+    if not access_token:
+        raise NotAuthenticated()
+    claims = decode_access_token(access_token)
+    if revocation_list.is_revoked(claims.get("jti")):
+        raise NotAuthenticated()
+    return AuthenticatedUser(claims=claims, db_session=db_session)
+
+
+CurrentUser = Annotated[AuthenticatedUser, Depends(get_current_user)]
+
+
+async def get_admin_user(current_user: CurrentUser) -> AuthenticatedUser:
+    """Only let through callers listed in ``ADMIN_EMAILS``."""
+    if current_user.email.lower() not in {email.lower() for email in settings.ADMIN_EMAILS}:
+        raise PermissionDenied()
+    return current_user
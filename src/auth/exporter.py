@@ -0,0 +1,77 @@
+import csv
+import io
+from collections.abc import AsyncIterator, Sequence
+from typing import Literal
+
+import orjson
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.models import EduUser
+from src.schemas import serialize_datetime
+
+ExportFormat = Literal["ndjson", "csv"]
+
+COLUMNS = ["id", "email", "created_at", "updated_at"]
+
+MEDIA_TYPES: dict[str, str] = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def detect_format(path: str) -> ExportFormat:
+    """Guess the output format from the file extension."""
+    return "csv" if path.endswith(".csv") else "ndjson"
+
+
+async def iter_user_batches(*, db_session: AsyncSession, batch_size: int) -> AsyncIterator[Sequence[Row]]:
+    """Yield all users in batches of ``batch_size`` rows from a server-side cursor.
+
+    Only one batch is held in memory at a time, and plain rows rather than
+    ORM objects are fetched, so nothing accumulates in the session either.
+    """
+    result = await db_session.stream(
+        select(EduUser.id, EduUser.email, EduUser.created_at, EduUser.updated_at)
+        .order_by(EduUser.id)
+        .execution_options(yield_per=batch_size)
+    )
+    async for rows in result.partitions():
+        yield rows
+
+
+def encode_header(fmt: ExportFormat) -> bytes:
+    """The CSV header row; NDJSON has none."""
+    return encode_csv([COLUMNS]) if fmt == "csv" else b""
+
+
+def encode_rows(rows: Sequence[Row], fmt: ExportFormat) -> bytes:
+    """Encode a batch of user rows as NDJSON lines or CSV records."""
+    if fmt == "csv":
+        return encode_csv(
+            (row.id, row.email, serialize_datetime(row.created_at), serialize_datetime(row.updated_at))
+            for row in rows
+        )
+    return b"".join(
+        orjson.dumps(
+            {
+                "id": row.id,
+                "email": row.email,
+                "created_at": serialize_datetime(row.created_at),
+                "updated_at": serialize_datetime(row.updated_at),
+            },
+            option=orjson.OPT_APPEND_NEWLINE,
+        )
+        for row in rows
+    )
+
+
+def encode_csv(records) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(records)
+    return buffer.getvalue().encode()
+
+
+async def export_users(*, db_session: AsyncSession, fmt: ExportFormat, batch_size: int) -> AsyncIterator[bytes]:
+    """Yield the user table as encoded chunks, one per fetched batch."""
+    if header := encode_header(fmt):
+        yield header
+    async for rows in iter_user_batches(db_session=db_session, batch_size=batch_size):
+        yield encode_rows(rows, fmt)
@@ -0,0 +1,142 @@
+import asyncio
+import logging
+import statistics
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from src.config import settings
+from src.exceptions import ServiceUnavailable
+from src.metrics import observe_password_hash
+
+logger = logging.getLogger(__name__)
+
+
+class HashingQueueFull(ServiceUnavailable):
+    DETAIL = "Too many concurrent password operations, try again later"
+
+
+def hash_password(password: str, rounds: int | None = None) -> bytes:
+    """Hash a password using bcrypt."""
+    import bcrypt
+
+    pw = bytes(password, "utf-8")
+    salt = bcrypt.gensalt(rounds=rounds or settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(pw, salt)
+
+
+def check_password(password: str, hashed: bytes) -> bool:
+    """Check a password against a bcrypt hash."""
+    import bcrypt
+
+    return bcrypt.checkpw(password.encode("utf-8"), hashed)
+
+
+def get_rounds(hashed: bytes) -> int:
+    """Return the cost factor encoded in a bcrypt hash ($2b$<rounds>$...)."""
+    return int(hashed[4:6])
+
+
+def needs_rehash(hashed: bytes) -> bool:
+    """Check whether a hash was created with a cost factor other than the configured one."""
+    return get_rounds(hashed) != settings.BCRYPT_ROUNDS
+
+
+def calibrate_rounds(target_ms: float, *, samples: int = 3, min_rounds: int = 4, max_rounds: int = 16) -> dict[int, float]:
+    """Measure the median bcrypt hash time in milliseconds per cost factor.
+
+    Stops at the first cost factor slower than ``target_ms`` since every
+    additional round doubles the work.
+    """
+    import bcrypt
+
+    timings: dict[int, float] = {}
+    for rounds in range(min_rounds, max_rounds + 1):
+        salt = bcrypt.gensalt(rounds=rounds)
+        durations = []
+        for _ in range(samples):
+            start = time.perf_counter()
+            bcrypt.hashpw(b"calibration-password", salt)
+            durations.append((time.perf_counter() - start) * 1000)
+        timings[rounds] = statistics.median(durations)
+        if timings[rounds] > target_ms:
+            break
+    return timings
+
+
+class PasswordHasher:
+    """Runs bcrypt on a bounded worker pool so it never blocks the event loop."""
+
+    def __init__(self, *, executor: str, max_workers: int, max_pending: int) -> None:
+        self._executor_kind = executor
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._executor: Executor | None = None
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of operations queued or running on the pool."""
+        return self._pending
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self._executor_kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="bcrypt"
+                )
+            logger.debug(f"Started {self._executor_kind} hashing pool with {self._max_workers} workers")
+        return self._executor
+
+    async def _run(self, operation: str, func, *args):
+        if self._pending >= self._max_pending:
+            raise HashingQueueFull()
+
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        future = self._get_executor().submit(func, *args)
+        self._pending += 1
+
+        def release() -> None:
+            self._pending -= 1
+            observe_password_hash(operation, start)
+
+        def on_done(_) -> None:
+            # runs on the worker once bcrypt has really finished, even if the caller was
+            # cancelled meanwhile; hand the bookkeeping back to the event loop thread
+            try:
+                loop.call_soon_threadsafe(release)
+            except RuntimeError:
+                pass  # loop already closed at shutdown
+
+        future.add_done_callback(on_done)
+        return await asyncio.wrap_future(future)
+
+    async def hash(self, password: str) -> bytes:
+        return await self._run("hash", hash_password, password)
+
+    async def verify(self, password: str, hashed: bytes) -> bool:
+        return await self._run("verify", check_password, password, hashed)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher: PasswordHasher = PasswordHasher(
+    executor=settings.HASHING_EXECUTOR,
+    max_workers=settings.HASHING_WORKERS,
+    max_pending=settings.HASHING_MAX_PENDING,
+)
+
+
+async def hash_password_async(password: str) -> bytes:
+    """Hash a password on the hashing pool."""
+    return await password_hasher.hash(password)
+
+
+async def verify_password_async(password: str, hashed: bytes) -> bool:
+    """Verify a password against a bcrypt hash on the hashing pool."""
+    return await password_hasher.verify(password, hashed)
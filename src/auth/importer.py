@@ -0,0 +1,159 @@
+import asyncio
+import csv
+import json
+import logging
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import batched
+from typing import TextIO
+
+from pydantic import ValidationError
+
+from src.auth.hashing import hash_password
+from src.auth.schemas import UserImport
+from src.constants import DB_SCHEMA
+from src.database.core import DatabaseSessionManager
+
+logger = logging.getLogger(__name__)
+
+STAGING_TABLE = "edu_users_import"
+
+
+@dataclass
+class ImportStats:
+    """Running counters for a bulk user import."""
+
+    read: int = 0
+    inserted: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    @property
+    def rate(self) -> float:
+        """Rows written (inserted or skipped as duplicates) per second."""
+        return (self.inserted + self.duplicates) / self.elapsed if self.elapsed else 0.0
+
+
+def detect_format(path: str) -> str:
+    """Guess the input format from the file extension."""
+    return "jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv"
+
+
+def read_rows(stream: TextIO, fmt: str) -> Iterator[dict]:
+    """Lazily yield raw user rows from a CSV (with header) or JSONL stream."""
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+        return
+
+    for line in stream:
+        if line.strip():
+            yield json.loads(line)
+
+
+def hash_passwords(passwords: list[str], rounds: int) -> list[bytes]:
+    """Hash a chunk of passwords; runs inside a worker process."""
+    return [hash_password(password, rounds) for password in passwords]
+
+
+def validate_rows(rows: Iterable[dict], stats: ImportStats) -> Iterator[tuple[str, str]]:
+    """Yield (email, password) for valid rows, counting the invalid ones."""
+    for line, row in enumerate(rows, start=1):
+        stats.read += 1
+        try:
+            user = UserImport.model_validate(row)
+        except ValidationError as e:
+            stats.invalid += 1
+            logger.warning(f"Skipping row {line}: {e.errors()[0]['msg']}")
+            continue
+        yield user.email, user.password
+
+
+async def hash_batch(
+    pool: Executor, batch: tuple[tuple[str, str], ...], *, workers: int, rounds: int
+) -> list[tuple[str, bytes]]:
+    """Hash a batch of passwords spread across all worker processes."""
+    loop = asyncio.get_running_loop()
+    emails = [email for email, _ in batch]
+    passwords = [password for _, password in batch]
+    chunk_size = max(1, -(-len(passwords) // workers))
+    chunks = await asyncio.gather(
+        *(
+            loop.run_in_executor(pool, hash_passwords, list(chunk), rounds)
+            for chunk in batched(passwords, chunk_size)
+        )
+    )
+    return list(zip(emails, (hashed for chunk in chunks for hashed in chunk)))
+
+
+async def write_batch(
+    session_manager: DatabaseSessionManager, records: list[tuple[str, bytes]]
+) -> int:
+    """COPY a batch into a staging table and merge it, skipping existing emails."""
+    async with session_manager.connect() as conn:
+        raw_connection = await conn.get_raw_connection()
+        driver = raw_connection.driver_connection
+        # SQLAlchemy has not begun a transaction on the raw connection yet; without one
+        # the ON COMMIT DROP table would be gone right after it is created
+        async with driver.transaction():
+            await driver.execute(
+                f"CREATE TEMP TABLE {STAGING_TABLE} (email text NOT NULL, password bytea NOT NULL) ON COMMIT DROP"
+            )
+            await driver.copy_records_to_table(STAGING_TABLE, records=records, columns=["email", "password"])
+            status = await driver.execute(
+                f"INSERT INTO {DB_SCHEMA}.edu_users (email, password) "
+                f"SELECT email, password FROM {STAGING_TABLE} "
+                "ON CONFLICT (lower(email)) DO NOTHING"
+            )
+    # asyncpg returns the command tag, e.g. "INSERT 0 4950"
+    return int(status.rsplit(" ", 1)[-1])
+
+
+async def import_users(
+    *,
+    session_manager: DatabaseSessionManager,
+    rows: Iterable[dict],
+    batch_size: int,
+    workers: int,
+    rounds: int,
+    on_progress: Callable[[ImportStats], None] | None = None,
+) -> ImportStats:
+    """Bulk import users, hashing the next batch while the current one is written.
+
+    At most two batches are held in memory, so input size is unbounded.
+    """
+    stats = ImportStats()
+
+    async def flush(hashing: asyncio.Future) -> None:
+        records = await hashing
+        inserted = await write_batch(session_manager, records)
+        stats.inserted += inserted
+        stats.duplicates += len(records) - inserted
+        if on_progress is not None:
+            on_progress(stats)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: asyncio.Future | None = None
+        for batch in batched(validate_rows(rows, stats), batch_size):
+            hashing = asyncio.ensure_future(hash_batch(pool, batch, workers=workers, rounds=rounds))
+            if pending is not None:
+                await flush(pending)
+            pending = hashing
+        if pending is not None:
+            await flush(pending)
+
+    return stats
+
+
+def open_input(path: str) -> TextIO:
+    """Open the import source, with '-' meaning stdin."""
+    if path == "-":
+        return sys.stdin
+    return open(path, encoding="utf-8", newline="")
@@ -0,0 +1,77 @@
+"""Signing keys for access tokens.
+
+With an HMAC ``JWT_ALG`` tokens are signed with ``JWT_SECRET``. With an
+RSA or EC algorithm, tokens are signed with the private key ``JWT_ACTIVE_KID``
+and carry its ``kid``; every key in ``JWT_PRIVATE_KEY_FILES`` is accepted
+for verification and published at ``/.well-known/jwks.json``.
+
+To rotate: add the new key to ``JWT_PRIVATE_KEY_FILES`` and deploy, so the
+new public key reaches the JWKS; then point ``JWT_ACTIVE_KID`` at it; drop
+the old key once tokens signed with it have expired.
+"""
+from functools import cache
+from typing import Any
+
+from src.config import settings
+
+HMAC_ALGORITHMS = frozenset({"HS256", "HS384", "HS512"})
+
+
+class KeyRing:
+    """Parsed jose key objects by ``kid``, built once so no call re-parses PEM."""
+
+    def __init__(self, *, algorithm: str, active_kid: str | None, key_files: dict[str, str]) -> None:
+        from jose import jwk
+
+        if active_kid not in key_files:
+            raise Exception(f"JWT_ACTIVE_KID {active_kid!r} is not one of JWT_PRIVATE_KEY_FILES")
+
+        self.algorithm = algorithm
+        self.active_kid = active_kid
+        self._signing_keys = {}
+        for kid, path in key_files.items():
+            with open(path, encoding="utf-8") as f:
+                self._signing_keys[kid] = jwk.construct(f.read(), algorithm)
+        self._verification_keys = {kid: key.public_key() for kid, key in self._signing_keys.items()}
+        self._jwks = {
+            "keys": [
+                {**key.to_dict(), "kid": kid, "use": "sig", "alg": algorithm}
+                for kid, key in self._verification_keys.items()
+            ]
+        }
+
+    @property
+    def signing_key(self) -> Any:
+        return self._signing_keys[self.active_kid]
+
+    def verification_key(self, kid: str | None) -> Any | None:
+        return self._verification_keys.get(kid)
+
+    def jwks(self) -> dict[str, list[dict[str, Any]]]:
+        """Public keys as a JSON Web Key Set."""
+        return self._jwks
+
+
+def uses_hmac() -> bool:
+    return settings.JWT_ALG in HMAC_ALGORITHMS
+
+
+@cache
+def get_key_ring() -> KeyRing:
+    return KeyRing(
+        algorithm=settings.JWT_ALG,
+        active_kid=settings.JWT_ACTIVE_KID,
+        key_files=settings.JWT_PRIVATE_KEY_FILES,
+    )
+
+
+@cache
+def get_hmac_key() -> Any:
+    from jose import jwk
+
+    return jwk.construct(settings.JWT_SECRET, settings.JWT_ALG)
+
+
+def public_jwks() -> dict[str, list[dict[str, Any]]]:
+    # shared secrets are never published
+    return {"keys": []} if uses_hmac() else get_key_ring().jwks()
@@ -1,13 +1,14 @@
 import secrets
 import string
-from datetime import datetime, timedelta, timezone
+from datetime import datetime
+from typing import NamedTuple
 
-import bcrypt
-from jose import jwt
-from sqlalchemy import Integer, LargeBinary, String
+from sqlalchemy import BigInteger, Boolean, DateTime, ForeignKey, Identity, Index, Integer, LargeBinary, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
-from src.config import settings
+from src.auth.hashing import check_password, hash_password
+from src.auth.tokens import create_access_token
+from src.constants import DB_SCHEMA
 from src.database.core import EduBase
 from src.models import TimeStampMixin
 
@@ -26,24 +27,40 @@ def generate_password() -> str:
             break
     return password
 
-def hash_password(password: str) -> bytes:
-    """Hash a password using bcrypt."""
-    pw = bytes(password, "utf-8")
-    salt = bcrypt.gensalt()
-    return bcrypt.hashpw(pw, salt)
+class UserRecord(NamedTuple):
+    """Plain snapshot of the user columns authentication needs, safe to cache."""
+
+    id: int
+    email: str
+    password: bytes
+
 
 class EduUser(EduBase, TimeStampMixin):
     __tablename__ = "edu_users"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    email: Mapped[str] = mapped_column(String, unique=True, nullable=False)
+    email: Mapped[str] = mapped_column(String, nullable=False)
     password: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
 
+    __table_args__ = (
+        # emails are unique case-insensitively; lookups must filter on lower(email) to use it
+        Index("edu_users_email_lower_key", func.lower(email), unique=True),
+        # pattern ops so email prefix filters (LIKE 'abc%') can use an index too
+        Index(
+            "edu_users_email_lower_pattern_idx",
+            func.lower(email).label("email_lower"),
+            postgresql_ops={"email_lower": "text_pattern_ops"},
+        ),
+        # keyset pagination of the user listing, newest first
+        Index("edu_users_created_at_id_idx", "created_at", "id"),
+        {"schema": DB_SCHEMA},
+    )
+
     def verify_password(self, password: str) -> bool:
         """ Verify the password against the stored hash. """
         if not self.password:
             raise ValueError("Password cannot be empty")
-        return bcrypt.checkpw(password.encode("utf-8"), self.password)
+        return check_password(password, self.password)
 
     def set_password(self, password: str) -> None:
         """ Set the password for the user. """
@@ -55,12 +72,47 @@ class EduUser(EduBase, TimeStampMixin):
     @property
     def token(self) -> str:
         """Generate a JWT token for the user."""
-        now = datetime.now(timezone.utc)
-        exp = (now + timedelta(seconds=settings.JWT_EXP)).timestamp()
-        data = {
-            "exp": exp,
-            "email": self.email,
-        }
-        return jwt.encode(data, settings.JWT_SECRET, algorithm=settings.JWT_ALG)
+        return create_access_token(self.email)
+
+
+class EduSession(EduBase):
+    """A refresh session; only the SHA-256 digest of the refresh token is stored."""
+
+    __tablename__ = "edu_sessions"
+
+    token_hash: Mapped[bytes] = mapped_column(LargeBinary(32), primary_key=True)
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey(EduUser.id, ondelete="CASCADE"), nullable=False, index=True
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+
+
+class EduRevokedToken(EduBase):
+    """An access token revoked before its expiry, identified by its ``jti`` claim."""
+
+    __tablename__ = "edu_revoked_tokens"
+
+    jti: Mapped[str] = mapped_column(String, primary_key=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    revoked_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, server_default=func.timezone("utc", func.now()), index=True
+    )
+
+
+class EduAuthEvent(EduBase):
+    """Append-only audit trail of authentication attempts, written in batches."""
+
+    __tablename__ = "edu_auth_events"
 
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    event: Mapped[str] = mapped_column(String, nullable=False)
+    email: Mapped[str] = mapped_column(String, nullable=False)
+    ip_address: Mapped[str] = mapped_column(String, nullable=False)
+    success: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    occurred_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
 
+    __table_args__ = (
+        # rows arrive in time order, so a BRIN index serves time-range queries at almost no write cost
+        Index("edu_auth_events_occurred_at_idx", occurred_at, postgresql_using="brin"),
+        {"schema": DB_SCHEMA},
+    )
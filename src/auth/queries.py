@@ -0,0 +1,23 @@
+"""Lean, ORM-free reads for the hot authentication path.
+
+Statements are built once at import time against the Core table, so each
+call skips ORM entity construction, identity-map bookkeeping and statement
+re-building; SQLAlchemy's compiled cache and asyncpg's prepared statement
+cache then make repeat executions a single round trip with no re-planning.
+"""
+from sqlalchemy import String, bindparam, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.models import EduUser, UserRecord
+
+users = EduUser.__table__
+
+select_record_by_email = select(users.c.id, users.c.email, users.c.password).where(
+    func.lower(users.c.email) == bindparam("email", type_=String)
+)
+
+
+async def fetch_record_by_email(*, db_session: AsyncSession, email: str) -> UserRecord | None:
+    """Fetch only the columns authentication needs, as a plain tuple."""
+    row = (await db_session.execute(select_record_by_email, {"email": email.lower()})).first()
+    return UserRecord._make(row) if row is not None else None
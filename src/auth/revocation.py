@@ -0,0 +1,109 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.models import EduRevokedToken
+from src.database.core import DatabaseSessionManager
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationList:
+    """Per-process set of revoked token ids, kept in sync with Postgres.
+
+    Request-time checks are a dict lookup. A background task polls for
+    revocations newer than the last one seen, so a token revoked on another
+    worker is rejected here within one sync interval. Rows are only read
+    until their token expires, after which the token is rejected anyway.
+    Polls go to the primary: replica lag could hide a row past the overlap.
+    """
+
+    # re-read this far back on each poll to catch transactions that committed late
+    OVERLAP = timedelta(seconds=5)
+
+    def __init__(self) -> None:
+        self._revoked: dict[str, float] = {}  # jti -> exp timestamp
+        self._synced_until: datetime | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    def is_revoked(self, jti: str | None) -> bool:
+        return jti is not None and jti in self._revoked
+
+    def add(self, jti: str, exp: float) -> None:
+        self._revoked[jti] = exp
+
+    async def sync(self, db_session: AsyncSession) -> int:
+        """Load revocations since the last sync (all live ones the first time)."""
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        query = select(EduRevokedToken.jti, EduRevokedToken.expires_at, EduRevokedToken.revoked_at).where(
+            EduRevokedToken.expires_at > now
+        )
+        if self._synced_until is not None:
+            query = query.where(EduRevokedToken.revoked_at > self._synced_until - self.OVERLAP)
+
+        rows = (await db_session.execute(query)).all()
+        for jti, expires_at, revoked_at in rows:
+            self._revoked[jti] = expires_at.replace(tzinfo=timezone.utc).timestamp()
+            if self._synced_until is None or revoked_at > self._synced_until:
+                self._synced_until = revoked_at
+        if self._synced_until is None:
+            self._synced_until = now
+        self._evict_expired()
+        return len(rows)
+
+    def _evict_expired(self) -> None:
+        now = time.time()
+        for jti in [jti for jti, exp in self._revoked.items() if exp <= now]:
+            del self._revoked[jti]
+
+    async def start(self, session_manager: DatabaseSessionManager, interval: float) -> None:
+        """Load the current revocations, then keep polling in the background."""
+        async with session_manager.session() as db_session:
+            await self.sync(db_session)
+        self._task = asyncio.create_task(self._poll(session_manager, interval))
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _poll(self, session_manager: DatabaseSessionManager, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with session_manager.session() as db_session:
+                    await self.sync(db_session)
+            except Exception:
+                # keep serving with the last known list; the next poll catches up
+                logger.exception("Failed to sync revoked tokens")
+
+
+revocation_list: RevocationList = RevocationList()
+
+
+async def revoke_token(*, db_session: AsyncSession, claims: dict) -> None:
+    """Persist the revocation of a token and apply it to this worker immediately."""
+    jti = claims.get("jti")
+    if jti is None:
+        # tokens minted before jti was added can't be revoked; they expire on their own
+        return
+    await db_session.execute(
+        insert(EduRevokedToken)
+        .values(jti=jti, expires_at=datetime.fromtimestamp(claims["exp"], timezone.utc).replace(tzinfo=None))
+        .on_conflict_do_nothing()
+    )
+    await db_session.commit()
+    revocation_list.add(jti, claims["exp"])
@@ -1,25 +1,77 @@
-from fastapi import APIRouter, HTTPException, Response, status
-from fastapi.responses import JSONResponse
+from typing import Annotated
 
+from fastapi import APIRouter, Cookie, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from src.auth.audit import audit_log
+from src.auth.dependencies import CurrentUser, get_admin_user
+from src.auth.exporter import MEDIA_TYPES, ExportFormat, export_users
+from src.auth.hashing import HashingQueueFull, needs_rehash, verify_password_async
+from src.auth.revocation import revoke_token
 from src.auth.schemas import (
+    UserListResponse,
     UserLogin,
     UserLoginResponse,
+    UserMeResponse,
     UserRegister,
     UserRegisterResponse,
 )
-from src.auth.services import create, get_by_email
+from src.auth.services import (
+    create,
+    create_session,
+    delete_session,
+    get_record_by_email,
+    list_users,
+    rehash_password,
+    rotate_session,
+)
+from src.auth.throttling import client_ip, throttle_login, throttle_register
+from src.auth.tokens import create_access_token, decode_access_token
+from src.background import background_jobs
 from src.config import settings
-from src.database.core import DBSession
+from src.database.core import get_session_manager
+from src.database.dependencies import DBSession, ReadDBSession
+from src.exceptions import BadRequest, NotAuthenticated
 
 auth_router = APIRouter()
 
-@auth_router.post("/register", response_model=UserRegisterResponse)
+
+def refresh_cookie_path() -> str:
+    # the refresh token is only ever sent to the auth endpoints
+    return f"{settings.API_V1_STR}/auth"
+
+
+def set_auth_cookies(response: Response, *, email: str, refresh_token: str) -> None:
+    """Set the short-lived access token and the refresh token as httpOnly cookies."""
+    response.set_cookie(
+        key="access_token",
+        value=create_access_token(email),
+        httponly=True,
+        secure=settings.ENVIRONMENT != "LOCAL",  # Use secure cookies in production
+        samesite="lax",
+        max_age=settings.JWT_EXP,  # same lifetime as the token, in seconds
+    )
+    response.set_cookie(
+        key="refresh_token",
+        value=refresh_token,
+        httponly=True,
+        secure=settings.ENVIRONMENT != "LOCAL",
+        samesite="lax",
+        max_age=settings.REFRESH_TOKEN_EXP,
+        path=refresh_cookie_path(),
+    )
+
+@auth_router.post(
+    "/register",
+    response_model=UserRegisterResponse,
+    dependencies=[Depends(throttle_register)],
+)
 async def register_user(
     user_in: UserRegister,
     db_session: DBSession,
 ):
-    user = await get_by_email(db_session=db_session, email=user_in.email)
-    if user:
+    user = await create(db_session=db_session, user_in=user_in)
+    if user is None:
         # Pydantic v2 compatible error handling
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -31,28 +83,35 @@ async def register_user(
                 }
             ],
         )
-
-    user = await create(db_session=db_session, user_in=user_in)
     return user
 
 
-@auth_router.post("/login", response_model=UserLoginResponse)
+@auth_router.post(
+    "/login",
+    response_model=UserLoginResponse,
+    dependencies=[Depends(throttle_login)],
+)
 async def login(
+    request: Request,
     user_in: UserLogin,
     db_session: DBSession,
     response: Response,
 ):
-    user = await get_by_email(db_session=db_session, email=user_in.email)
-    if user and user.verify_password(user_in.password):
-        # Set httpOnly cookie
-        response.set_cookie(
-            key="access_token",
-            value=user.token,
-            httponly=True,
-            secure=settings.ENVIRONMENT != "LOCAL",  # Use secure cookies in production
-            samesite="lax",
-            max_age=settings.JWT_EXP * 60,  # Convert minutes to seconds
-        )
+    user = await get_record_by_email(email=user_in.email)
+    try:
+        success = user is not None and await verify_password_async(user_in.password, user.password)
+    except HashingQueueFull:
+        # shed attempts are audited too, without checking credentials
+        await audit_log.record("login", email=user_in.email, ip_address=client_ip(request), success=False)
+        raise
+    await audit_log.record("login", email=user_in.email, ip_address=client_ip(request), success=success)
+    if success:
+        if needs_rehash(user.password):
+            # upgrade the cost factor off the request path
+            background_jobs.enqueue(rehash_password, user_id=user.id, password=user_in.password)
+
+        refresh_token = await create_session(db_session=db_session, user_id=user.id)
+        set_auth_cookies(response, email=user.email, refresh_token=refresh_token)
         return UserLoginResponse(
             email=user.email,
             message="Login successful"
@@ -69,16 +128,85 @@ async def login(
     )
 
 
+@auth_router.post("/refresh", response_model=UserLoginResponse)
+async def refresh(
+    db_session: DBSession,
+    response: Response,
+    refresh_token: Annotated[str | None, Cookie()] = None,
+):
+    # rotates the refresh session; no password check, so no bcrypt
+    if not refresh_token:
+        raise NotAuthenticated()
+    rotated = await rotate_session(db_session=db_session, refresh_token=refresh_token)
+    if rotated is None:
+        raise NotAuthenticated()
+
+    email, new_refresh_token = rotated
+    set_auth_cookies(response, email=email, refresh_token=new_refresh_token)
+    return UserLoginResponse(
+        email=email,
+        message="Session refreshed"
+    )
+
+
 @auth_router.post("/logout")
-async def logout(response: Response):
+async def logout(
+    db_session: DBSession,
+    response: Response,
+    access_token: Annotated[str | None, Cookie()] = None,
+    refresh_token: Annotated[str | None, Cookie()] = None,
+):
+    if refresh_token:
+        await delete_session(db_session=db_session, refresh_token=refresh_token)
+    if access_token:
+        try:
+            claims = decode_access_token(access_token)
+        except NotAuthenticated:
+            pass  # already unusable, nothing to revoke
+        else:
+            await revoke_token(db_session=db_session, claims=claims)
     response.delete_cookie(key="access_token")
+    response.delete_cookie(key="refresh_token", path=refresh_cookie_path())
     return {"message": "Logged out successfully"}
 
 
-@auth_router.get("/me")
-async def get_current_user(
-    db_session: DBSession,
-    # We'll add cookie authentication dependency later
+@auth_router.get("/me", response_model=UserMeResponse)
+async def get_current_user(current_user: CurrentUser):
+    # the email comes from the verified token, no database round trip
+    return UserMeResponse(email=current_user.email)
+
+
+@auth_router.get(
+    "/users",
+    response_model=UserListResponse,
+    dependencies=[Depends(get_admin_user)],
+)
+async def get_users(
+    db_session: ReadDBSession,
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+    cursor: str | None = None,
+    email_prefix: Annotated[str | None, Query(max_length=254)] = None,
 ):
-    # TODO: Implement cookie-based authentication
-    return {"message": "Not implemented yet"}
+    # pass next_cursor back as cursor for the following page
+    try:
+        users, next_cursor = await list_users(
+            db_session=db_session, limit=limit, cursor=cursor, email_prefix=email_prefix
+        )
+    except ValueError:
+        raise BadRequest()
+    return UserListResponse(items=users, next_cursor=next_cursor)
+
+
+@auth_router.get("/users/export", dependencies=[Depends(get_admin_user)])
+async def export_users_stream(fmt: Annotated[ExportFormat, Query(alias="format")] = "ndjson"):
+    async def body():
+        # opened here, not as a dependency, so the session lives as long as the stream
+        async with get_session_manager().read_session() as db_session:
+            async for chunk in export_users(db_session=db_session, fmt=fmt, batch_size=settings.EXPORT_BATCH_SIZE):
+                yield chunk
+
+    return StreamingResponse(
+        body(),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="users.{fmt}"'},
+    )
@@ -1,7 +1,7 @@
-from pydantic import EmailStr, field_validator
+from pydantic import EmailStr, Field, field_validator
 
-from src.auth.models import generate_password, hash_password
-from src.schemas import EduBase
+from src.auth.models import generate_password
+from src.schemas import EduBase, EduDateTime
 
 
 class UserBase(EduBase):
@@ -16,6 +16,12 @@ class UserBase(EduBase):
             raise ValueError("Must not be empty string")
         return v
 
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, v: str) -> str:
+        """Lowercase the email; emails are unique and looked up case-insensitively."""
+        return v.lower()
+
 
 class UserLogin(UserBase):
     """Pydantic model for user login data."""
@@ -33,16 +39,13 @@ class UserLogin(UserBase):
 class UserRegister(UserBase):
     """Pydantic model for user registration data."""
 
-    password: str = ""
+    password: str = Field(default="", validate_default=True)
 
     @field_validator("password", mode="before")
     @classmethod
-    def generate_or_hash_password(cls, v: str | bytes) -> bytes:
-        """Generate and hash a password if not provided."""
-        if isinstance(v, bytes):
-            return v
-        password = v or generate_password()
-        return hash_password(password)
+    def default_password(cls, v: str | None) -> str:
+        """Generate a password if not provided; hashing happens in the service layer."""
+        return v or generate_password()
 
 class UserCreate(UserBase):
     """Pydantic model for user creation data."""
@@ -50,11 +53,25 @@ class UserCreate(UserBase):
 
     @field_validator("password", mode="before")
     @classmethod
-    def hash(cls, v: str | None) -> bytes:
-        """Hash the password before storing."""
+    def password_required(cls, v: str | None) -> str:
+        """Ensure a password is provided; hashing happens in the service layer."""
         if v is None:
             raise ValueError("Password cannot be None")
-        return hash_password(str(v))
+        return str(v)
+
+
+class UserImport(UserBase):
+    """Pydantic model for a bulk imported user; the password is never generated."""
+
+    password: str
+
+    @field_validator("password")
+    @classmethod
+    def password_required(cls, v: str) -> str:
+        """Ensure the password field is not empty; nobody could log in otherwise."""
+        if not v:
+            raise ValueError("Must not be empty string")
+        return v
 
 
 class UserLoginResponse(UserBase):
@@ -65,3 +82,21 @@ class UserLoginResponse(UserBase):
 class UserRegisterResponse(UserBase):
     """Pydantic model for user registration response data."""
     access_token: str | None = None
+
+
+class UserMeResponse(UserBase):
+    """Pydantic model for the current user response data."""
+
+
+class UserListItem(EduBase):
+    """Pydantic model for a user in the admin listing."""
+    id: int
+    email: str
+    created_at: EduDateTime
+    updated_at: EduDateTime
+
+
+class UserListResponse(EduBase):
+    """Pydantic model for a page of the admin user listing."""
+    items: list[UserListItem]
+    next_cursor: str | None = None
@@ -1,21 +1,98 @@
 # Service for auth module
-from sqlalchemy import insert, select
+import base64
+import json
+import logging
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import Row, delete, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
-from src.auth.models import EduUser
+from src.auth.cache import user_cache
+from src.auth.hashing import hash_password_async
+from src.auth.models import EduRevokedToken, EduSession, EduUser, UserRecord
+from src.auth.queries import fetch_record_by_email
 from src.auth.schemas import UserCreate, UserRegister
+from src.auth.tokens import create_refresh_token, hash_refresh_token
+from src.config import settings
+from src.database.core import DatabaseSessionManager, get_session_manager
+
+logger = logging.getLogger(__name__)
 
 async def get_by_email(*, db_session: AsyncSession, email: str) -> EduUser | None:
     """Returns a user object based on user email."""
     return (
-        await db_session.execute(select(EduUser).where(EduUser.email == email))
+        await db_session.execute(select(EduUser).where(func.lower(EduUser.email) == email.lower()))
     ).scalar_one_or_none()
 
 
-async def create(*, db_session: AsyncSession, user_in: (UserRegister | UserCreate)) -> EduUser:
-    """Creates a new edu user."""
-    # pydantic forces a string password, but we really want bytes
-    password = bytes(user_in.password, "utf-8")
+async def get_record_by_email(*, email: str) -> UserRecord | None:
+    """Returns the cached authentication record for a user email.
+
+    A miss is loaded on a session owned by the load itself rather than by the
+    caller, so a cancelled request can't break the requests sharing the load.
+    """
+    email = email.lower()
+    return await user_cache.get(email, lambda: _load_record_by_email(email))
+
+
+async def _load_record_by_email(email: str) -> UserRecord | None:
+    session_manager = get_session_manager()
+    async with session_manager.read_session() as db_session:
+        record = await fetch_record_by_email(db_session=db_session, email=email)
+    if record is None and session_manager.has_replicas:
+        # a user registered moments ago may not have reached the replica yet
+        async with session_manager.session() as db_session:
+            record = await fetch_record_by_email(db_session=db_session, email=email)
+    return record
+
+
+def encode_user_cursor(created_at: datetime, user_id: int) -> str:
+    """Opaque cursor pointing just past the given user in the listing order."""
+    payload = json.dumps([created_at.isoformat(), user_id]).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_user_cursor(cursor: str) -> tuple[datetime, int]:
+    """Inverse of ``encode_user_cursor``; raises ValueError for a malformed cursor."""
+    try:
+        created_at, user_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return datetime.fromisoformat(created_at), int(user_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor {cursor!r}") from e
+
+
+async def list_users(
+    *, db_session: AsyncSession, limit: int, cursor: str | None = None, email_prefix: str | None = None
+) -> tuple[Sequence[Row], str | None]:
+    """Returns a page of users, newest first, and the cursor of the next page (None on the last page).
+
+    Keyset pagination on (created_at, id): each page seeks straight to its
+    position in edu_users_created_at_id_idx, so deep pages cost the same as the first.
+    """
+    query = (
+        select(EduUser.id, EduUser.email, EduUser.created_at, EduUser.updated_at)
+        .order_by(EduUser.created_at.desc(), EduUser.id.desc())
+        .limit(limit + 1)  # one extra row tells whether there is a next page
+    )
+    if cursor is not None:
+        query = query.where(tuple_(EduUser.created_at, EduUser.id) < decode_user_cursor(cursor))
+    if email_prefix:
+        query = query.where(func.lower(EduUser.email).startswith(email_prefix.lower(), autoescape=True))
+
+    rows = (await db_session.execute(query)).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_user_cursor(rows[-1].created_at, rows[-1].id)
+
+
+async def create(*, db_session: AsyncSession, user_in: (UserRegister | UserCreate)) -> EduUser | None:
+    """Creates a new edu user, returning None if the email is already taken."""
+    # hash on the worker pool so bcrypt never blocks the event loop
+    password = await hash_password_async(user_in.password)
 
     # create the user data dictionary
     user = {
@@ -23,6 +100,128 @@ async def create(*, db_session: AsyncSession, user_in: (UserRegister | UserCreat
         "password": password,
     }
 
-    result = await db_session.execute(insert(EduUser).values(user).returning(EduUser))
+    # a single round trip that is race-free against concurrent registrations
+    result = await db_session.execute(
+        insert(EduUser)
+        .values(user)
+        .on_conflict_do_nothing(index_elements=[func.lower(EduUser.email)])
+        .returning(EduUser)
+    )
+    created = result.scalar_one_or_none()
     await db_session.commit()
-    return result.scalar_one()
+    user_cache.invalidate(user_in.email.lower())
+    return created
+
+
+async def update_password(*, db_session: AsyncSession, user_id: int, password: str) -> None:
+    """Hashes and stores a new password for the given user."""
+    password_hash = await hash_password_async(password)
+    result = await db_session.execute(
+        update(EduUser).where(EduUser.id == user_id).values(password=password_hash).returning(EduUser.email)
+    )
+    email = result.scalar_one_or_none()
+    await db_session.commit()
+    if email is not None:
+        user_cache.invalidate(email.lower())
+
+
+async def rehash_password(*, user_id: int, password: str) -> None:
+    """Re-hashes a password with the configured cost factor after a successful login."""
+    async with get_session_manager().session() as db_session:
+        await update_password(db_session=db_session, user_id=user_id, password=password)
+    logger.debug(f"Rehashed password for user {user_id}")
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+async def create_session(*, db_session: AsyncSession, user_id: int) -> str:
+    """Starts a refresh session for the user and returns its refresh token."""
+    token, token_hash = create_refresh_token()
+    await db_session.execute(
+        insert(EduSession).values(
+            token_hash=token_hash,
+            user_id=user_id,
+            expires_at=_utcnow() + timedelta(seconds=settings.REFRESH_TOKEN_EXP),
+        )
+    )
+    await db_session.commit()
+    return token
+
+
+async def rotate_session(*, db_session: AsyncSession, refresh_token: str) -> tuple[str, str] | None:
+    """Swaps a valid refresh token for a new one; returns (email, new token) or None.
+
+    The old session is deleted in the same transaction, so each refresh token
+    can be used exactly once.
+    """
+    now = _utcnow()
+    consumed = (
+        delete(EduSession)
+        .where(EduSession.token_hash == hash_refresh_token(refresh_token), EduSession.expires_at > now)
+        .returning(EduSession.user_id)
+        .cte("consumed")
+    )
+    user = (
+        await db_session.execute(select(EduUser.id, EduUser.email).join(consumed, consumed.c.user_id == EduUser.id))
+    ).first()
+    if user is None:
+        await db_session.rollback()
+        return None
+
+    token, token_hash = create_refresh_token()
+    await db_session.execute(
+        insert(EduSession).values(
+            token_hash=token_hash,
+            user_id=user.id,
+            expires_at=now + timedelta(seconds=settings.REFRESH_TOKEN_EXP),
+        )
+    )
+    await db_session.commit()
+    return user.email, token
+
+
+async def delete_session(*, db_session: AsyncSession, refresh_token: str) -> None:
+    """Ends the refresh session for the given token, if it exists."""
+    await db_session.execute(delete(EduSession).where(EduSession.token_hash == hash_refresh_token(refresh_token)))
+    await db_session.commit()
+
+
+async def _purge_expired(
+    *, session_manager: DatabaseSessionManager, key: InstrumentedAttribute, expires_at: InstrumentedAttribute, batch_size: int
+) -> int:
+    """Deletes expired rows in batches, each in its own short transaction."""
+    expired = (
+        select(key)
+        .where(expires_at <= func.timezone("utc", func.now()))
+        .limit(batch_size)
+        .scalar_subquery()
+    )
+    purged = 0
+    while True:
+        async with session_manager.connect() as conn:
+            result = await conn.execute(delete(key.class_).where(key.in_(expired)))
+        purged += result.rowcount
+        if result.rowcount < batch_size:
+            return purged
+
+
+async def purge_expired_sessions(*, session_manager: DatabaseSessionManager, batch_size: int) -> int:
+    """Deletes expired refresh sessions."""
+    return await _purge_expired(
+        session_manager=session_manager,
+        key=EduSession.token_hash,
+        expires_at=EduSession.expires_at,
+        batch_size=batch_size,
+    )
+
+
+async def purge_expired_revocations(*, session_manager: DatabaseSessionManager, batch_size: int) -> int:
+    """Deletes revocations of tokens that have expired anyway."""
+    return await _purge_expired(
+        session_manager=session_manager,
+        key=EduRevokedToken.jti,
+        expires_at=EduRevokedToken.expires_at,
+        batch_size=batch_size,
+    )
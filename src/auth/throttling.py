@@ -0,0 +1,111 @@
+import importlib
+import math
+import time
+from collections import OrderedDict
+from typing import Protocol
+
+from fastapi import Request
+
+from src.auth.audit import audit_log
+from src.auth.schemas import UserLogin
+from src.config import settings
+from src.exceptions import TooManyRequests
+
+
+class RateLimitBackend(Protocol):
+    """Storage for rate limit counters.
+
+    ``hit`` records one request against ``key`` and returns 0 when it is
+    allowed, or the number of seconds until the client may retry.
+    """
+
+    async def hit(self, key: str, *, limit: int, window: int) -> float: ...
+
+
+class MemoryRateLimitBackend:
+    """Sliding window counters held in this process.
+
+    Each key keeps the counts for the current and previous fixed windows and
+    weights the previous one by how much of it still overlaps the sliding
+    window, so memory per key is constant. Keys are kept in the order they
+    were last hit, and the least recently hit one makes room for a new key,
+    so a full limiter costs no more per request than an empty one.
+    """
+
+    def __init__(self, *, max_keys: int) -> None:
+        self._max_keys = max_keys
+        # key -> [window index, previous window count, current window count]
+        self._counters: OrderedDict[str, list[int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+    async def hit(self, key: str, *, limit: int, window: int) -> float:
+        now = time.time()
+        index, offset = divmod(now, window)
+        index = int(index)
+
+        counter = self._counters.get(key)
+        if counter is None:
+            if len(self._counters) >= self._max_keys:
+                self._counters.popitem(last=False)
+            counter = self._counters[key] = [index, 0, 0]
+        else:
+            self._counters.move_to_end(key)
+            if counter[0] != index:
+                counter[1] = counter[2] if counter[0] == index - 1 else 0
+                counter[2] = 0
+                counter[0] = index
+
+        weight = 1 - offset / window
+        if counter[1] * weight + counter[2] >= limit:
+            if counter[2] >= limit:
+                return window - offset
+            # wait until enough of the previous window has slid out
+            return max(1.0, window * (1 - (limit - counter[2]) / counter[1]) - offset)
+
+        counter[2] += 1
+        return 0
+
+
+def load_backend(name: str) -> RateLimitBackend:
+    """Build the configured backend: "memory" or a "package.module:ClassName" path."""
+    if name == "memory":
+        return MemoryRateLimitBackend(max_keys=settings.RATE_LIMIT_MAX_KEYS)
+
+    module_name, _, class_name = name.partition(":")
+    backend_class = getattr(importlib.import_module(module_name), class_name)
+    return backend_class()
+
+
+rate_limiter: RateLimitBackend = load_backend(settings.RATE_LIMIT_BACKEND)
+
+
+def client_ip(request: Request) -> str:
+    return request.client.host if request.client else "unknown"
+
+
+async def throttle(key: str, limit: int) -> None:
+    """Reject the request with a 429 once ``key`` exceeds ``limit`` per window."""
+    if not settings.RATE_LIMIT_ENABLED:
+        return
+    retry_after = await rate_limiter.hit(key, limit=limit, window=settings.RATE_LIMIT_WINDOW)
+    if retry_after:
+        raise TooManyRequests(retry_after=math.ceil(retry_after))
+
+
+async def throttle_login(request: Request, user_in: UserLogin) -> None:
+    """Limit login attempts per client IP and per target email."""
+    ip_address = client_ip(request)
+    try:
+        await throttle(f"login:ip:{ip_address}", settings.RATE_LIMIT_LOGIN_PER_IP)
+        await throttle(f"login:email:{user_in.email}", settings.RATE_LIMIT_LOGIN_PER_EMAIL)
+    except TooManyRequests:
+        # rejected attempts are audited too, without checking credentials
+        await audit_log.record("login_throttled", email=user_in.email, ip_address=ip_address, success=False)
+        raise
+
+
+async def throttle_register(request: Request) -> None:
+    """Limit registrations per client IP."""
+    await throttle(f"register:ip:{client_ip(request)}", settings.RATE_LIMIT_REGISTER_PER_IP)
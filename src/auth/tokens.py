@@ -0,0 +1,102 @@
+import hashlib
+import secrets
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from src.auth.keys import get_hmac_key, get_key_ring, uses_hmac
+from src.config import settings
+from src.exceptions import NotAuthenticated
+
+
+class TokenCache:
+    """Bounded LRU of verified token claims, keyed by the token's SHA-256 digest.
+
+    Entries expire at the token's own ``exp`` so a cached token is never
+    accepted past its lifetime.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[bytes, dict[str, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: bytes) -> dict[str, Any] | None:
+        claims = self._entries.get(key)
+        if claims is None:
+            return None
+        if claims["exp"] <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return claims
+
+    def set(self, key: bytes, claims: dict[str, Any]) -> None:
+        self._entries[key] = claims
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+token_cache: TokenCache = TokenCache(maxsize=settings.JWT_CACHE_SIZE)
+
+
+def create_access_token(email: str) -> str:
+    """Mint a signed access token for the given email."""
+    from jose import jwt
+
+    now = datetime.now(timezone.utc)
+    exp = (now + timedelta(seconds=settings.JWT_EXP)).timestamp()
+    data = {
+        "exp": exp,
+        "email": email,
+        "jti": secrets.token_urlsafe(16),
+    }
+    if uses_hmac():
+        return jwt.encode(data, get_hmac_key(), algorithm=settings.JWT_ALG)
+    key_ring = get_key_ring()
+    return jwt.encode(data, key_ring.signing_key, algorithm=settings.JWT_ALG, headers={"kid": key_ring.active_kid})
+
+
+def decode_access_token(token: str) -> dict[str, Any]:
+    """Verify an access token and return its claims, using the verified-token cache."""
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    claims = token_cache.get(key)
+    if claims is not None:
+        return claims
+
+    from jose import JWTError, jwt
+
+    try:
+        if uses_hmac():
+            verification_key = get_hmac_key()
+        else:
+            # pick the verification key by kid so rotated-out keys keep working until removed
+            verification_key = get_key_ring().verification_key(jwt.get_unverified_header(token).get("kid"))
+            if verification_key is None:
+                raise NotAuthenticated()
+        claims = jwt.decode(token, verification_key, algorithms=[settings.JWT_ALG])
+    except JWTError:
+        raise NotAuthenticated()
+    if "email" not in claims or "exp" not in claims:
+        raise NotAuthenticated()
+
+    token_cache.set(key, claims)
+    return claims
+
+
+def create_refresh_token() -> tuple[str, bytes]:
+    """Return a new opaque refresh token and the digest to store for it."""
+    token = secrets.token_urlsafe(32)
+    return token, hash_refresh_token(token)
+
+
+def hash_refresh_token(token: str) -> bytes:
+    # refresh tokens are random, so a plain digest is enough to keep them unusable if leaked from the DB
+    return hashlib.sha256(token.encode("utf-8")).digest()
@@ -0,0 +1,117 @@
+"""In-process background jobs for side effects that must not delay a response.
+
+Handlers call ``background_jobs.enqueue(func, **kwargs)`` and return at once;
+a fixed set of worker tasks started in the lifespan runs the coroutine,
+retrying failures with exponential backoff. The queue is bounded: when it is
+full the job is dropped and counted, so a slow database can never grow
+memory without limit or push latency back onto requests. Jobs live in
+memory only and are lost if the process dies, so use this for work that is
+safe to lose (rehashing, last-login updates, notifications).
+"""
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, NamedTuple
+
+from src.metrics import BACKGROUND_JOB_DURATION, BACKGROUND_JOBS, BACKGROUND_QUEUE_DEPTH
+
+logger = logging.getLogger(__name__)
+
+
+class Job(NamedTuple):
+    func: Callable[..., Awaitable[Any]]
+    kwargs: dict[str, Any]
+
+    @property
+    def name(self) -> str:
+        return self.func.__name__
+
+
+class BackgroundJobRunner:
+    def __init__(self) -> None:
+        self._queue: asyncio.Queue[Job] | None = None
+        self._workers: list[asyncio.Task[None]] = []
+        self._accepting = False
+        self._max_attempts = 1
+        self._retry_backoff = 0.0
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def start(self, *, workers: int, queue_size: int, max_attempts: int, retry_backoff: float) -> None:
+        self._queue = asyncio.Queue(maxsize=queue_size)
+        self._max_attempts = max_attempts
+        self._retry_backoff = retry_backoff
+        self._workers = [asyncio.create_task(self._work(), name=f"background-worker-{i}") for i in range(workers)]
+        self._accepting = True
+
+    def enqueue(self, func: Callable[..., Awaitable[Any]], /, **kwargs: Any) -> bool:
+        """Queue ``func(**kwargs)`` without waiting; False if it was dropped."""
+        job = Job(func, kwargs)
+        if not self._accepting or self._queue is None:
+            logger.warning(f"Background jobs are not running, dropping {job.name}")
+            BACKGROUND_JOBS.labels(job.name, "dropped").inc()
+            return False
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            logger.warning(f"Background queue is full, dropping {job.name}")
+            BACKGROUND_JOBS.labels(job.name, "dropped").inc()
+            return False
+        BACKGROUND_QUEUE_DEPTH.set(self._queue.qsize())
+        return True
+
+    async def _work(self) -> None:
+        assert self._queue is not None
+        while True:
+            job = await self._queue.get()
+            BACKGROUND_QUEUE_DEPTH.set(self._queue.qsize())
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        duration = BACKGROUND_JOB_DURATION.labels(job.name)
+        for attempt in range(1, self._max_attempts + 1):
+            start = time.perf_counter()
+            try:
+                await job.func(**job.kwargs)
+            except Exception:
+                duration.observe(time.perf_counter() - start)
+                if attempt == self._max_attempts:
+                    logger.exception(f"Background job {job.name} failed after {attempt} attempts")
+                    BACKGROUND_JOBS.labels(job.name, "failed").inc()
+                    return
+                BACKGROUND_JOBS.labels(job.name, "retried").inc()
+                # exponential backoff with jitter so retries of a shared failure spread out
+                await asyncio.sleep(self._retry_backoff * 2 ** (attempt - 1) * random.uniform(0.5, 1.5))
+            else:
+                duration.observe(time.perf_counter() - start)
+                BACKGROUND_JOBS.labels(job.name, "succeeded").inc()
+                return
+
+    async def drain(self, timeout: float) -> bool:
+        """Stop accepting jobs, run what is queued for up to ``timeout`` seconds, then stop the workers."""
+        self._accepting = False
+        if self._queue is None:
+            return True
+        drained = True
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except TimeoutError:
+            drained = False
+            logger.warning(f"{self._queue.qsize()} background jobs still queued after {timeout}s, dropping them")
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        BACKGROUND_QUEUE_DEPTH.set(0)
+        return drained
+
+
+background_jobs: BackgroundJobRunner = BackgroundJobRunner()
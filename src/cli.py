@@ -2,10 +2,11 @@ import click
 import logging
 import sys
 import asyncio
+import os
 from functools import wraps
 
-from src.database.core import session_manager
-from src.database.manage import drop_database, init_database
+# Command dependencies are imported inside each command so ``--help`` and
+# unrelated commands don't pay for the database driver, bcrypt or settings.
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +22,50 @@ def edu_cli():
     """CLI for the edu project."""
     pass
 
+@edu_cli.command("serve")
+@click.option("--host", default="0.0.0.0", show_default=True)
+@click.option("--port", default=8000, show_default=True)
+@click.option("--workers", type=int, default=None, help="Worker processes, defaults to the available CPUs.")
+@click.option(
+    "--db-connections",
+    type=int,
+    default=None,
+    help="Connections per database server shared by all workers, defaults to DATABASE_CONNECTION_BUDGET.",
+)
+@click.option("--graceful-timeout", default=30, show_default=True, help="Seconds to drain requests on shutdown/reload.")
+@click.option("--keep-alive", default=5, show_default=True, help="Idle keep-alive timeout in seconds.")
+@click.option("--backlog", default=2048, show_default=True, help="Listen socket backlog.")
+@click.option("--access-log/--no-access-log", default=False, show_default=True)
+def serve_cmd(
+    host: str,
+    port: int,
+    workers: int | None,
+    db_connections: int | None,
+    graceful_timeout: int,
+    keep_alive: int,
+    backlog: int,
+    access_log: bool,
+):
+    """Run the API with multiple workers (SIGHUP reloads workers one by one)."""
+    from src.config import settings
+    from src.server import configure_workers, default_workers, event_loop, http_protocol, serve
+
+    workers = workers or default_workers()
+    pool = configure_workers(db_connections or settings.DATABASE_CONNECTION_BUDGET, workers)
+    click.echo(
+        f"Starting {workers} workers ({event_loop()}, {http_protocol()}) with "
+        f"pool_size={pool.pool_size} max_overflow={pool.max_overflow} each"
+    )
+    serve(
+        host=host,
+        port=port,
+        workers=workers,
+        graceful_timeout=graceful_timeout,
+        keep_alive=keep_alive,
+        backlog=backlog,
+        access_log=access_log,
+    )
+
 @edu_cli.group("database")
 def edu_database():
     """Container for all edu database commands."""
@@ -30,18 +75,187 @@ def edu_database():
 @make_sync
 async def init_db():
     """Initialize the database."""
+    from src.database.core import get_session_manager
+    from src.database.manage import init_database
+
     click.echo("Initializing database...")
-    await init_database(session_manager=session_manager)
+    await init_database(session_manager=get_session_manager())
     click.secho("Database initialized successfully", fg="green")
     
 @edu_database.command("drop")
 @make_sync
 async def drop_db():
     """Drop the database."""
+    from src.database.core import get_session_manager
+    from src.database.manage import drop_database
+
     click.echo("Dropping database...")
-    await drop_database(session_manager=session_manager)
+    await drop_database(session_manager=get_session_manager())
     click.secho("Database dropped successfully", fg="green")
     
+@edu_database.command("import-users")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False, allow_dash=True))
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(["csv", "jsonl"]),
+    default=None,
+    help="Input format, guessed from the file extension by default.",
+)
+@click.option("--batch-size", default=5000, show_default=True, help="Rows per COPY batch.")
+@click.option("--workers", type=int, default=None, help="Hashing processes, defaults to the CPU count.")
+@click.option(
+    "--rounds",
+    type=int,
+    default=None,
+    help="bcrypt cost factor, defaults to BCRYPT_ROUNDS. Lower values are upgraded on next login.",
+)
+@make_sync
+async def import_users_cmd(path: str, fmt: str | None, batch_size: int, workers: int | None, rounds: int | None):
+    """Bulk import users from a CSV or JSONL file ('-' for stdin)."""
+    from src.auth.importer import ImportStats, detect_format, import_users, open_input, read_rows
+    from src.config import settings
+    from src.database.core import get_session_manager
+
+    fmt = fmt or detect_format(path)
+    workers = workers or os.cpu_count() or 1
+
+    def report(stats: "ImportStats") -> None:
+        click.echo(
+            f"{stats.read} read, {stats.inserted} inserted, {stats.duplicates} duplicates, "
+            f"{stats.invalid} invalid ({stats.rate:.0f} rows/s)"
+        )
+
+    click.echo(f"Importing users from {path} ({fmt}, {workers} hashing workers)...")
+    with open_input(path) as stream:
+        stats = await import_users(
+            session_manager=get_session_manager(),
+            rows=read_rows(stream, fmt),
+            batch_size=batch_size,
+            workers=workers,
+            rounds=rounds or settings.BCRYPT_ROUNDS,
+            on_progress=report,
+        )
+    click.secho(
+        f"Imported {stats.inserted} users in {stats.elapsed:.1f}s "
+        f"({stats.duplicates} duplicates, {stats.invalid} invalid)",
+        fg="green",
+    )
+
+@edu_database.command("export-users")
+@click.argument("path", type=click.Path(dir_okay=False, allow_dash=True), default="-")
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(["ndjson", "csv"]),
+    default=None,
+    help="Output format, guessed from the file extension by default (ndjson for stdout).",
+)
+@click.option("--batch-size", default=None, type=int, help="Rows per fetch, defaults to EXPORT_BATCH_SIZE.")
+@make_sync
+async def export_users_cmd(path: str, fmt: str | None, batch_size: int | None):
+    """Stream all users to a CSV or NDJSON file ('-' for stdout)."""
+    from src.auth.exporter import detect_format, encode_header, encode_rows, iter_user_batches
+    from src.config import settings
+    from src.database.core import get_session_manager
+
+    fmt = fmt or detect_format(path)
+    exported = 0
+    # progress goes to stderr so stdout carries only the export
+    click.echo(f"Exporting users to {path} ({fmt})...", err=True)
+    with click.open_file(path, "wb") as output:
+        output.write(encode_header(fmt))
+        async with get_session_manager().read_session() as db_session:
+            async for rows in iter_user_batches(
+                db_session=db_session, batch_size=batch_size or settings.EXPORT_BATCH_SIZE
+            ):
+                output.write(encode_rows(rows, fmt))
+                exported += len(rows)
+    click.secho(f"Exported {exported} users", fg="green", err=True)
+
+@edu_database.command("purge-sessions")
+@click.option("--batch-size", default=10_000, show_default=True, help="Sessions deleted per transaction.")
+@make_sync
+async def purge_sessions(batch_size: int):
+    """Delete expired refresh sessions and token revocations."""
+    from src.auth.services import purge_expired_revocations, purge_expired_sessions
+    from src.database.core import get_session_manager
+
+    click.echo("Purging expired sessions...")
+    session_manager = get_session_manager()
+    sessions = await purge_expired_sessions(session_manager=session_manager, batch_size=batch_size)
+    revocations = await purge_expired_revocations(session_manager=session_manager, batch_size=batch_size)
+    click.secho(f"Purged {sessions} expired sessions and {revocations} expired token revocations", fg="green")
+
+@edu_cli.group("auth")
+def edu_auth():
+    """Container for all edu auth commands."""
+    pass
+
+@edu_auth.command("calibrate-bcrypt")
+@click.option("--target-ms", default=250.0, show_default=True, help="Target hash latency in milliseconds.")
+@click.option("--samples", default=3, show_default=True, help="Hashes measured per cost factor.")
+@click.option(
+    "--env-file",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Write the chosen BCRYPT_ROUNDS into this env file.",
+)
+def calibrate_bcrypt(target_ms: float, samples: int, env_file: str | None):
+    """Pick the bcrypt cost factor that fits the target latency on this host."""
+    from src.auth.hashing import calibrate_rounds
+    from src.config import settings
+
+    click.echo(f"Measuring bcrypt hash time (target {target_ms:.0f} ms)...")
+    timings = calibrate_rounds(target_ms, samples=samples)
+    for rounds, elapsed in timings.items():
+        click.echo(f"  rounds={rounds:<3} {elapsed:8.1f} ms")
+
+    within_target = [rounds for rounds, elapsed in timings.items() if elapsed <= target_ms]
+    chosen = max(within_target) if within_target else min(timings)
+    click.secho(f"BCRYPT_ROUNDS={chosen} (currently {settings.BCRYPT_ROUNDS})", fg="green")
+
+    if env_file:
+        write_env_value(env_file, "BCRYPT_ROUNDS", str(chosen))
+        click.echo(f"Updated {env_file}")
+
+@edu_auth.command("generate-signing-key")
+@click.argument("path", type=click.Path(dir_okay=False, exists=False))
+@click.option("--key-size", default=2048, show_default=True, help="RSA key size in bits.")
+def generate_signing_key(path: str, key_size: int):
+    """Write a new RSA private key (PEM) for RS256 access tokens."""
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=key_size)
+    pem = private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+    # create it readable by the owner only
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(pem)
+    click.secho(f"Wrote {path}; add it to JWT_PRIVATE_KEY_FILES under a new kid", fg="green")
+
+def write_env_value(path: str, key: str, value: str) -> None:
+    """Set ``key=value`` in an env file, replacing an existing entry."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        lines = []
+
+    entry = f"{key}={value}"
+    for i, line in enumerate(lines):
+        if line.split("=", 1)[0].strip() == key:
+            lines[i] = entry
+            break
+    else:
+        lines.append(entry)
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
 def main():
     """Main entry point for the CLI."""
     try:
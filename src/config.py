@@ -1,7 +1,10 @@
+from functools import cache
+from typing import Any, Literal
+
 from pydantic import PostgresDsn
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from src.constants import DB_NAMING_CONVENTION, Environment
+from src.constants import Environment
 
 
 class CustomBaseSettings(BaseSettings):
@@ -13,16 +16,60 @@ class CustomBaseSettings(BaseSettings):
 class Config(CustomBaseSettings):
     DATABASE_ASYNC_URL: PostgresDsn
     DATABASE_POOL_SIZE: int = 16
+    DATABASE_MAX_OVERFLOW: int = 10
     DATABASE_POOL_TTL: int = 60 * 20  # 20 minutes
     DATABASE_POOL_PRE_PING: bool = True
-    DATABASE_NAMING_CONVENTION: dict[str, str] = DB_NAMING_CONVENTION
+    DATABASE_POOL_WARMUP: int | None = None  # connections opened at startup, defaults to pool size
+    DATABASE_DRAIN_TIMEOUT: float = 10.0  # seconds to wait for open sessions on shutdown
     DATABASE_ECHO: bool = False
-    DATABASE_SCHEMA: str = "edu_core"
+    DATABASE_COMPILED_CACHE_SIZE: int = 500  # SQLAlchemy compiled statement cache per engine
+    DATABASE_STATEMENT_CACHE_SIZE: int = 256  # asyncpg prepared statements per connection
+    DATABASE_REPLICA_URLS: list[PostgresDsn] = []
+    DATABASE_REPLICA_POOL_SIZE: int = 16
+    DATABASE_REPLICA_MAX_OVERFLOW: int = 10
+    DATABASE_CONNECTION_BUDGET: int = 64  # per database server, split across `cli serve` workers
+    DATABASE_REPLICA_RETRY_AFTER: int = 30  # seconds a failed replica stays out of rotation
     ENVIRONMENT: Environment = Environment.LOCAL
 
     JWT_SECRET: str
     JWT_ALG: str
-    JWT_EXP: int
+    JWT_EXP: int  # access token lifetime in seconds
+    JWT_CACHE_SIZE: int = 10_000  # verified tokens kept in memory per worker
+    # RS*/ES* algorithms only: PEM private key files by kid, and the kid that signs new tokens
+    JWT_PRIVATE_KEY_FILES: dict[str, str] = {}
+    JWT_ACTIVE_KID: str | None = None
+    REFRESH_TOKEN_EXP: int = 60 * 60 * 24 * 30  # 30 days, in seconds
+    TOKEN_REVOCATION_SYNC_INTERVAL: float = 5.0  # seconds until other workers see a revocation
+    ADMIN_EMAILS: list[str] = []  # may use the admin endpoints; nobody unless configured
+    EXPORT_BATCH_SIZE: int = 5000  # rows fetched per round trip by user exports
+
+    USER_CACHE_SIZE: int = 10_000
+    USER_CACHE_TTL: float = 30.0  # seconds; other workers accept an old password this long after a change
+
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"  # or "package.module:ClassName" for a shared store
+    RATE_LIMIT_MAX_KEYS: int = 100_000
+    RATE_LIMIT_WINDOW: int = 60  # seconds
+    RATE_LIMIT_LOGIN_PER_IP: int = 30
+    RATE_LIMIT_LOGIN_PER_EMAIL: int = 10
+    RATE_LIMIT_REGISTER_PER_IP: int = 10
+
+    BCRYPT_ROUNDS: int = 12  # pick per host with `cli auth calibrate-bcrypt`
+    HASHING_EXECUTOR: Literal["thread", "process"] = "thread"
+    HASHING_WORKERS: int = 4
+    HASHING_MAX_PENDING: int = 64  # queued + running operations before rejecting
+
+    AUDIT_FLUSH_INTERVAL: float = 0.5  # seconds between writes of the audit buffer
+    AUDIT_FLUSH_SIZE: int = 1000  # write early once this many events are waiting
+    AUDIT_BUFFER_SIZE: int = 50_000
+    AUDIT_OVERFLOW_POLICY: Literal["block", "drop_newest", "drop_oldest"] = "block"
+    AUDIT_BLOCK_TIMEOUT: float = 1.0  # longest a request waits for buffer space under "block"
+
+    BACKGROUND_WORKERS: int = 4
+    BACKGROUND_QUEUE_SIZE: int = 1000  # jobs beyond this are dropped
+    BACKGROUND_MAX_ATTEMPTS: int = 3
+    BACKGROUND_RETRY_BACKOFF: float = 0.5  # seconds before the first retry, doubled each time
+    BACKGROUND_DRAIN_TIMEOUT: float = 10.0
 
     # @field_validator("JWT_SECRET")
     # def validate_jwt_secret(cls, v: str) -> str:
@@ -60,4 +107,23 @@ class Config(CustomBaseSettings):
     LOG_LEVEL: str = "DEBUG"
 
 
-settings = Config()
+@cache
+def get_settings() -> Config:
+    """Build the settings (reading .env) once, on first use."""
+    return Config()
+
+
+class LazySettings:
+    """Stand-in for ``Config`` that defers loading until an attribute is read.
+
+    Each value is copied onto the proxy on first access, so later reads are
+    plain attribute lookups.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(get_settings(), name)
+        setattr(self, name, value)
+        return value
+
+
+settings: Config = LazySettings()  # type: ignore[assignment]
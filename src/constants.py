@@ -1,5 +1,9 @@
 from enum import Enum
 
+# fixed rather than a setting: the models are declared with it at import time
+# and the migrations are written against it
+DB_SCHEMA = "edu_core"
+
 DB_NAMING_CONVENTION: dict[str, str] = {
     "ix": "%(column_0_label)s_idx",
     "uq": "%(table_name)s_%(column_0_name)s_key",
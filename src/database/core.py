@@ -1,10 +1,14 @@
+import asyncio
 import contextlib
+import functools
+import itertools
 import logging
+import time
 from collections.abc import AsyncGenerator
-from typing import Annotated, Any, ClassVar
+from typing import Any, ClassVar
 
-from fastapi import Depends
 from sqlalchemy import Engine, MetaData, text, create_engine
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import (
     AsyncConnection,
     AsyncEngine,
@@ -15,81 +19,265 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.orm import DeclarativeBase
 
 from src.config import settings
+from src.constants import DB_NAMING_CONVENTION, DB_SCHEMA
+from src.database.pool import InstrumentedAsyncAdaptedQueuePool, PoolStats, instrument_pool
+from src.metrics import instrument_engine
 
 logger = logging.getLogger(__name__)
 
 class EduBase(DeclarativeBase):
-    metadata: ClassVar[MetaData] = MetaData(naming_convention=settings.DATABASE_NAMING_CONVENTION, schema=settings.DATABASE_SCHEMA)
-    __table_args__: dict[str, Any] = {"schema": settings.DATABASE_SCHEMA}
+    metadata: ClassVar[MetaData] = MetaData(naming_convention=DB_NAMING_CONVENTION, schema=DB_SCHEMA)
+    __table_args__: dict[str, Any] = {"schema": DB_SCHEMA}
 
-class DatabaseSessionManager:
-    def __init__(self, host: str, engine_kwargs: dict[str, Any]) -> None:
-        self._async_engine: AsyncEngine | None = create_async_engine(
-            url = host,
-            **engine_kwargs,
+def create_instrumented_engine(host: str, engine_kwargs: dict[str, Any], name: str) -> tuple[AsyncEngine, PoolStats]:
+    """Create an async engine with statement timing and pool instrumentation."""
+    engine = create_async_engine(
+        url = host,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        **engine_kwargs,
+    )
+    instrument_engine(engine.sync_engine)
+    return engine, instrument_pool(engine.sync_engine, name=name)
+
+async def warm_up_pool(engine: AsyncEngine, connections: int | None = None) -> tuple[int, list[Exception]]:
+    """Open ``connections`` pooled connections concurrently and return them to the pool.
+
+    Defaults to the pool size; more would only open overflow connections that
+    are discarded on check-in. Returns how many opened and the errors raised.
+    """
+    pool_size = engine.sync_engine.pool.size()
+    connections = max(1, min(pool_size if connections is None else connections, pool_size))
+
+    async with contextlib.AsyncExitStack() as stack:
+        # hold every connection until all are open, so each checkout opens a new one
+        async def open_connection() -> None:
+            connection = await stack.enter_async_context(engine.connect())
+            await connection.execute(text("SELECT 1"))
+
+        results = await asyncio.gather(*(open_connection() for _ in range(connections)), return_exceptions=True)
+
+    errors = [result for result in results if isinstance(result, Exception)]
+    return connections - len(errors), errors
+
+class ReplicaEngine:
+    """A read replica with its own pool, taken out of rotation after connection failures."""
+
+    def __init__(self, name: str, host: str, engine_kwargs: dict[str, Any]) -> None:
+        self.name = name
+        self.engine, self.pool_stats = create_instrumented_engine(host, engine_kwargs, name)
+        self.sessionmaker: async_sessionmaker[AsyncSession] = async_sessionmaker(
+            autocommit=False,
+            bind=self.engine,
+            expire_on_commit=False,
         )
+        self.unhealthy_until = 0.0
+
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.unhealthy_until
+
+    def mark_unhealthy(self, retry_after: float) -> None:
+        self.unhealthy_until = time.monotonic() + retry_after
+
+class DatabaseSessionManager:
+    def __init__(
+        self,
+        host: str,
+        engine_kwargs: dict[str, Any],
+        replica_hosts: list[str] | None = None,
+        replica_engine_kwargs: dict[str, Any] | None = None,
+        replica_retry_after: float = 30.0,
+    ) -> None:
+        self._async_engine: AsyncEngine | None
+        self._async_engine, self._pool_stats = create_instrumented_engine(host, engine_kwargs, "primary")
         self._sessionmaker: async_sessionmaker[AsyncSession] | None = async_sessionmaker(
             autocommit=False,
             bind=self._async_engine,
             expire_on_commit=False,
         )
+        self._replicas: list[ReplicaEngine] = [
+            ReplicaEngine(f"replica-{i}", replica_host, replica_engine_kwargs or engine_kwargs)
+            for i, replica_host in enumerate(replica_hosts or [])
+        ]
+        self._replica_cycle = itertools.cycle(range(len(self._replicas)))
+        self._replica_retry_after = replica_retry_after
+        self._in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    @property
+    def sessions_in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self._replicas)
 
-    async def startup(self) -> None:
+    async def startup(self, warm_up: int | None = None) -> None:
+        """Check connectivity and pre-open pooled connections.
+
+        ``warm_up`` connections (default: the whole pool) are opened concurrently
+        per engine, so the first requests don't pay for connection setup;
+        ``0`` only checks that the database answers.
+        """
         if self._async_engine is None:
             raise Exception("DatabaseSessionManager is not initialized")
 
-        async with self._async_engine.connect() as connection:
-            await connection.execute(text("SELECT 1"))
-            logger.debug("Connect database successfully")
+        opened, errors = await warm_up_pool(self._async_engine, warm_up)
+        if not opened:
+            raise errors[0]
+        if errors:
+            logger.warning(f"Opened {opened} database connections, {len(errors)} failed: {errors[0]!r}")
+        logger.debug(f"Connect database successfully ({opened} connections)")
+
+        for replica in self._replicas:
+            opened, errors = await warm_up_pool(replica.engine, warm_up)
+            if opened:
+                logger.debug(f"Connect {replica.name} successfully ({opened} connections)")
+            else:
+                # a replica being down must not block startup; reads fall back to the primary
+                replica.mark_unhealthy(self._replica_retry_after)
+                logger.warning(f"Could not connect to {replica.name}, routing its reads to the primary")
+
+    async def drain(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for open sessions to finish; True if none are left."""
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+            return True
+        except TimeoutError:
+            logger.warning(f"{self._in_flight} database sessions still open after {timeout}s, closing anyway")
+            return False
+
+    @contextlib.contextmanager
+    def _track(self):
+        self._in_flight += 1
+        self._idle.clear()
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            if not self._in_flight:
+                self._idle.set()
 
     async def close(self) -> None:
         if self._async_engine is None:
             raise Exception("DatabaseSessionManager is not initialized")
 
         await self._async_engine.dispose()
+        for replica in self._replicas:
+            await replica.engine.dispose()
         self._async_engine = None
         self._sessionmaker = None
+        self._replicas = []
+
+    def pool_status(self) -> dict[str, Any]:
+        """Current pool occupancy plus checkout wait, hold time and invalidation counters."""
+        if self._async_engine is None:
+            raise Exception("DatabaseSessionManager is not initialized")
+
+        status = {"primary": self._pool_stats.snapshot(self._async_engine.sync_engine.pool)}
+        for replica in self._replicas:
+            status[replica.name] = {
+                **replica.pool_stats.snapshot(replica.engine.sync_engine.pool),
+                "healthy": replica.healthy,
+            }
+        return status
 
     @contextlib.asynccontextmanager
     async def connect(self) -> AsyncGenerator[AsyncConnection, None]:
         if self._async_engine is None:
             raise Exception("DatabaseSessionManager is not initialized")
 
-        async with self._async_engine.begin() as connection:
+        with self._track():
+            async with self._async_engine.begin() as connection:
+                try:
+                    yield connection
+                except Exception:
+                    await connection.rollback()
+                    raise
+
+    @contextlib.asynccontextmanager
+    async def session(self) -> AsyncGenerator[AsyncSession, None]:
+        if self._sessionmaker is None:
+            raise Exception("DatabaseSessionManager is not initialized")
+
+        with self._track():
+            session: AsyncSession = self._sessionmaker()
             try:
-                yield connection
+                yield session
             except Exception:
-                await connection.rollback()
+                await session.rollback()
                 raise
+            finally:
+                await session.close()
+
+    async def _replica_session(self) -> AsyncSession | None:
+        """Open a session on the next healthy replica, or None if none can connect."""
+        for _ in range(len(self._replicas)):
+            replica = self._replicas[next(self._replica_cycle)]
+            if not replica.healthy:
+                continue
+
+            session = replica.sessionmaker()
+            try:
+                # check out the connection now so a dead replica is detected here
+                await session.connection()
+                return session
+            except (DBAPIError, OSError, TimeoutError):
+                await session.close()
+                replica.mark_unhealthy(self._replica_retry_after)
+                logger.warning(f"{replica.name} is unavailable, retrying it in {self._replica_retry_after}s")
+        return None
 
     @contextlib.asynccontextmanager
-    async def session(self) -> AsyncGenerator[AsyncSession, None]:
+    async def read_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """A session for read-only work, load-balanced across healthy replicas.
+
+        Falls back to the primary when no replica is configured or reachable.
+        Anything that must see its own writes should use ``session`` instead.
+        """
         if self._sessionmaker is None:
             raise Exception("DatabaseSessionManager is not initialized")
 
-        session: AsyncSession = self._sessionmaker()
-        try:
-            yield session
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+        with self._track():
+            session = await self._replica_session() or self._sessionmaker()
+            try:
+                yield session
+            except Exception:
+                await session.rollback()
+                raise
+            finally:
+                await session.close()
 
-session_manager: DatabaseSessionManager = DatabaseSessionManager(
+@functools.cache
+def get_session_manager() -> DatabaseSessionManager:
+    """Create the application's session manager (and its engines) on first use."""
+    return DatabaseSessionManager(
         host=str(settings.DATABASE_ASYNC_URL),
         engine_kwargs={
             "pool_size": settings.DATABASE_POOL_SIZE,
+            "max_overflow": settings.DATABASE_MAX_OVERFLOW,
             "pool_recycle": settings.DATABASE_POOL_TTL,
             "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
             "echo": settings.DATABASE_ECHO,
+            "query_cache_size": settings.DATABASE_COMPILED_CACHE_SIZE,
+            "connect_args": {"prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE},
         },
+        replica_hosts=[str(url) for url in settings.DATABASE_REPLICA_URLS],
+        replica_engine_kwargs={
+            "pool_size": settings.DATABASE_REPLICA_POOL_SIZE,
+            "max_overflow": settings.DATABASE_REPLICA_MAX_OVERFLOW,
+            "pool_recycle": settings.DATABASE_POOL_TTL,
+            "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+            "echo": settings.DATABASE_ECHO,
+            "query_cache_size": settings.DATABASE_COMPILED_CACHE_SIZE,
+            "connect_args": {"prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE},
+        },
+        replica_retry_after=settings.DATABASE_REPLICA_RETRY_AFTER,
     )
 
-async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    async with session_manager.session() as session:
-        yield session
-
-DBSession = Annotated[AsyncSession, Depends(get_db_session)]
-
-
+def __getattr__(name: str) -> Any:
+    # keep `from src.database.core import session_manager` working, built lazily
+    if name == "session_manager":
+        return get_session_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
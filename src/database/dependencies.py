@@ -0,0 +1,20 @@
+from collections.abc import AsyncGenerator
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.core import get_session_manager
+
+
+async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
+    async with get_session_manager().session() as session:
+        yield session
+
+DBSession = Annotated[AsyncSession, Depends(get_db_session)]
+
+async def get_read_db_session() -> AsyncGenerator[AsyncSession, None]:
+    async with get_session_manager().read_session() as session:
+        yield session
+
+ReadDBSession = Annotated[AsyncSession, Depends(get_read_db_session)]
@@ -1,9 +1,10 @@
-from sqlalchemy import Table, select
+from sqlalchemy import Table, func, select
 from sqlalchemy.schema import CreateSchema, DropSchema
 import logging
 
 from src.auth.models import EduUser, hash_password
 from src.config import settings
+from src.constants import DB_SCHEMA
 from src.database.core import DatabaseSessionManager, EduBase
 from src.database.utils import database_exists, create_database
 
@@ -13,7 +14,7 @@ def get_core_tables() -> list[Table]:
     """Fetches tables that belong to the 'edu_core' schema."""
     core_tables: list[Table] = []
     for _, table in EduBase.metadata.tables.items():
-        if table.schema == settings.DATABASE_SCHEMA:
+        if table.schema == DB_SCHEMA:
             core_tables.append(table)
     return core_tables
 
@@ -25,7 +26,7 @@ async def init_database(*, session_manager: DatabaseSessionManager):
     if not await database_exists(str(settings.DATABASE_ASYNC_URL)):
         await create_database(str(settings.DATABASE_ASYNC_URL))
        
-    schema_name = settings.DATABASE_SCHEMA
+    schema_name = DB_SCHEMA
     tables = get_core_tables()
 
     # Create schema (in separate transaction to handle if it already exists)
@@ -43,7 +44,7 @@ async def init_database(*, session_manager: DatabaseSessionManager):
     
     # Create default user
     async with session_manager.session() as session:
-        result = await session.execute(select(EduUser).filter(EduUser.email == "admin@edu.com"))
+        result = await session.execute(select(EduUser).filter(func.lower(EduUser.email) == "admin@edu.com"))
         existing_user = result.scalar_one_or_none()
         
         if not existing_user:
@@ -60,5 +61,5 @@ async def drop_database(*, session_manager: DatabaseSessionManager):
     """
     async with session_manager.connect() as conn:
         await conn.run_sync(EduBase.metadata.drop_all)
-        await conn.execute(DropSchema(settings.DATABASE_SCHEMA))
+        await conn.execute(DropSchema(DB_SCHEMA))
         logger.info("Database cleanup completed")
@@ -0,0 +1,162 @@
+import time
+from typing import Any
+
+from sqlalchemy import Engine, event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+from src.metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUT_TIMEOUTS,
+    DB_POOL_CHECKOUT_WAIT,
+    DB_POOL_CONNECTION_HOLD,
+    DB_POOL_INVALIDATIONS,
+    DB_POOL_OVERFLOW,
+)
+
+
+class PoolStats:
+    """Counters for one connection pool, fed by pool events."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.checkouts = 0
+        self.checkout_wait_total = 0.0
+        self.checkout_wait_max = 0.0
+        self.checkout_timeouts = 0
+        self.hold_total = 0.0
+        self.hold_max = 0.0
+        self.checkins = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.soft_invalidations = 0
+        self.pre_ping_failures = 0
+        self._checkout_wait = DB_POOL_CHECKOUT_WAIT.labels(name)
+        self._hold = DB_POOL_CONNECTION_HOLD.labels(name)
+        self._checked_out = DB_POOL_CHECKED_OUT.labels(name)
+        self._overflow = DB_POOL_OVERFLOW.labels(name)
+
+    def record_wait(self, elapsed: float) -> None:
+        self.checkouts += 1
+        self.checkout_wait_total += elapsed
+        self.checkout_wait_max = max(self.checkout_wait_max, elapsed)
+        self._checkout_wait.observe(elapsed)
+
+    def record_timeout(self) -> None:
+        self.checkout_timeouts += 1
+        DB_POOL_CHECKOUT_TIMEOUTS.labels(self.name).inc()
+
+    def record_hold(self, elapsed: float) -> None:
+        self.checkins += 1
+        self.hold_total += elapsed
+        self.hold_max = max(self.hold_max, elapsed)
+        self._hold.observe(elapsed)
+
+    def record_invalidation(self, kind: str) -> None:
+        if kind == "pre_ping":
+            self.pre_ping_failures += 1
+        elif kind == "soft":
+            self.soft_invalidations += 1
+        else:
+            self.invalidations += 1
+        DB_POOL_INVALIDATIONS.labels(self.name, kind).inc()
+
+    def update_gauges(self, pool: Pool, *, returning: bool = False) -> None:
+        """Set the gauges from the pool's counts.
+
+        ``returning`` is set on checkin, which fires before the connection is
+        back in the pool: it still counts as checked out, and when the queue is
+        already full it is an overflow connection that is about to be closed.
+        """
+        checked_out = pool.checkedout()
+        overflow = pool.overflow()
+        if returning:
+            checked_out -= 1
+            if 0 < pool.size() <= pool.checkedin():
+                overflow -= 1
+        self._checked_out.set(checked_out)
+        self._overflow.set(max(0, overflow))
+
+    def snapshot(self, pool: Pool) -> dict[str, Any]:
+        return {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(0, pool.overflow()),
+            "checkouts": self.checkouts,
+            "checkout_wait_avg_ms": round(self.checkout_wait_total / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+            "checkout_wait_max_ms": round(self.checkout_wait_max * 1000, 3),
+            "checkout_timeouts": self.checkout_timeouts,
+            "hold_avg_ms": round(self.hold_total / self.checkins * 1000, 3) if self.checkins else 0.0,
+            "hold_max_ms": round(self.hold_max * 1000, 3),
+            "connects": self.connects,
+            "invalidations": self.invalidations,
+            "soft_invalidations": self.soft_invalidations,
+            "pre_ping_failures": self.pre_ping_failures,
+        }
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that times how long a checkout waits for a connection.
+
+    No pool event fires before a checkout starts waiting, so the wait is
+    measured around ``_do_get``, which blocks on the queue or opens a new
+    connection.
+    """
+
+    stats: PoolStats | None = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            if self.stats is not None:
+                self.stats.record_timeout()
+            raise
+        if self.stats is not None:
+            self.stats.record_wait(time.perf_counter() - start)
+        return record
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+def instrument_pool(engine: Engine, name: str) -> PoolStats:
+    """Attach PoolStats to the engine's pool and keep it updated from pool events.
+
+    ``engine.pool`` is looked up on every event because invalidating the whole
+    pool replaces it; listeners carry over to the new pool.
+    """
+    stats = PoolStats(name)
+    pool = engine.pool
+    if isinstance(pool, InstrumentedAsyncAdaptedQueuePool):
+        pool.stats = stats
+
+    @event.listens_for(pool, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        stats.connects += 1
+
+    @event.listens_for(pool, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checked_out_at"] = time.perf_counter()
+        stats.update_gauges(engine.pool)
+
+    @event.listens_for(pool, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            stats.record_hold(time.perf_counter() - checked_out_at)
+        stats.update_gauges(engine.pool, returning=True)
+
+    @event.listens_for(pool, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        # a DisconnectionError during checkout is how a failed pre-ping surfaces
+        stats.record_invalidation("pre_ping" if isinstance(exception, exc.DisconnectionError) else "hard")
+
+    @event.listens_for(pool, "soft_invalidate")
+    def on_soft_invalidate(dbapi_connection, connection_record, exception):
+        stats.record_invalidation("soft")
+
+    return stats
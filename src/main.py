@@ -2,12 +2,21 @@ import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api import api_router
+from src.auth.audit import audit_log
+from src.auth.cache import user_cache
+from src.auth.dependencies import get_admin_user
+from src.auth.hashing import password_hasher
+from src.auth.keys import get_key_ring, public_jwks, uses_hmac
+from src.auth.revocation import revocation_list
+from src.background import background_jobs
 from src.config import settings
-from src.database.core import session_manager
+from src.database.core import get_session_manager
+from src.metrics import MetricsMiddleware, metrics_response
 
 LOG_FORMAT_DEBUG = "%(levelname)s:%(message)s:%(pathname)s:%(funcName)s:%(lineno)d"
 logging.basicConfig(level=logging.DEBUG if settings.LOG_LEVEL == "DEBUG" else logging.INFO, format=LOG_FORMAT_DEBUG)
@@ -15,11 +24,27 @@ logging.basicConfig(level=logging.DEBUG if settings.LOG_LEVEL == "DEBUG" else lo
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
-    await session_manager.startup()
+    if not uses_hmac():
+        get_key_ring()  # fail fast on a missing or unreadable signing key
+    session_manager = get_session_manager()
+    await session_manager.startup(warm_up=settings.DATABASE_POOL_WARMUP)
+    await revocation_list.start(session_manager, interval=settings.TOKEN_REVOCATION_SYNC_INTERVAL)
+    audit_log.start(session_manager)
+    background_jobs.start(
+        workers=settings.BACKGROUND_WORKERS,
+        queue_size=settings.BACKGROUND_QUEUE_SIZE,
+        max_attempts=settings.BACKGROUND_MAX_ATTEMPTS,
+        retry_backoff=settings.BACKGROUND_RETRY_BACKOFF,
+    )
     yield
     # Shutdown
+    await background_jobs.drain(settings.BACKGROUND_DRAIN_TIMEOUT)
+    await audit_log.stop()
+    await revocation_list.stop()
     if session_manager._async_engine is not None:
+        await session_manager.drain(settings.DATABASE_DRAIN_TIMEOUT)
         await session_manager.close()
+    password_hasher.close()
 
 app = FastAPI(
     openapi_url="",
@@ -34,6 +59,34 @@ app.add_middleware(
     allow_headers=settings.CORS_HEADERS,
 )
 
+app.add_middleware(MetricsMiddleware)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return metrics_response()
+
+
+@app.get("/.well-known/jwks.json", include_in_schema=False)
+async def jwks():
+    # lets other services verify access tokens without holding our secret
+    return ORJSONResponse(public_jwks(), headers={"Cache-Control": "public, max-age=300"})
+
+
+@app.get("/internal/diagnostics", include_in_schema=False, dependencies=[Depends(get_admin_user)])
+async def diagnostics() -> dict:
+    # pool and worker internals, for ADMIN_EMAILS only
+    return {
+        "database_pools": get_session_manager().pool_status(),
+        "database_sessions_in_flight": get_session_manager().sessions_in_flight,
+        "user_cache": user_cache.stats(),
+        "revoked_tokens": len(revocation_list),
+        "hashing": {"pending": password_hasher.pending},
+        "background_queue_depth": background_jobs.depth,
+        "audit_log": {"buffered": audit_log.buffered, "written": audit_log.written, "dropped": audit_log.dropped},
+    }
+
+
 api = FastAPI(
     title="SaaS01 API",
     version=settings.APP_VERSION,
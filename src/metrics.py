@@ -0,0 +1,202 @@
+"""Prometheus metrics for the API.
+
+With several uvicorn workers, set ``PROMETHEUS_MULTIPROC_DIR`` to an empty
+directory before start-up; every worker then writes its samples there and
+``/metrics`` aggregates them, whichever worker serves the scrape.
+"""
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import Engine, event
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests by route and status.",
+    ["method", "route", "status"],
+)
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route and status.",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served.",
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "bcrypt hash/verify latency including time queued for a worker.",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 1.0, 2.5, 5.0),
+)
+DB_STATEMENT_DURATION = Histogram(
+    "db_statement_duration_seconds",
+    "Database statement execution time by statement type.",
+    ["statement"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+BACKGROUND_QUEUE_DEPTH = Gauge(
+    "background_queue_depth",
+    "Background jobs waiting for a worker.",
+    multiprocess_mode="livesum",
+)
+BACKGROUND_JOBS = Counter(
+    "background_jobs_total",
+    "Background job outcomes (succeeded, retried, failed, dropped).",
+    ["job", "outcome"],
+)
+BACKGROUND_JOB_DURATION = Histogram(
+    "background_job_duration_seconds",
+    "Background job run time per attempt.",
+    ["job"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+AUDIT_BUFFERED = Gauge(
+    "audit_events_buffered",
+    "Audit events waiting to be written.",
+    multiprocess_mode="livesum",
+)
+AUDIT_EVENTS = Counter(
+    "audit_events_total",
+    "Audit events by outcome (written, dropped).",
+    ["outcome"],
+)
+AUDIT_FLUSH_DURATION = Histogram(
+    "audit_flush_duration_seconds",
+    "Time to write one batch of audit events.",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection.",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0),
+)
+DB_POOL_CONNECTION_HOLD = Histogram(
+    "db_pool_connection_hold_seconds",
+    "Time a connection stays checked out of the pool.",
+    ["pool"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 10.0),
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Connections currently checked out of the pool.",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Connections open beyond pool_size.",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up waiting for a connection.",
+    ["pool"],
+)
+DB_POOL_INVALIDATIONS = Counter(
+    "db_pool_invalidations_total",
+    "Invalidated connections by kind (hard, soft, pre_ping).",
+    ["pool", "kind"],
+)
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording request count, latency and concurrency.
+
+    Routes are labelled by their path template, never the raw URL, to keep
+    label cardinality bounded. Labelled children are cached after first use.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._children: dict[tuple[str, str, int], tuple[Counter, Histogram]] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            REQUESTS_IN_FLIGHT.dec()
+            key = (scope["method"], route_label(scope), status_code)
+            children = self._children.get(key)
+            if children is None:
+                labels = (key[0], key[1], str(key[2]))
+                children = self._children[key] = (REQUESTS.labels(*labels), REQUEST_DURATION.labels(*labels))
+            children[0].inc()
+            children[1].observe(elapsed)
+
+
+def route_label(scope: Scope) -> str:
+    """Path template of the matched route, including the mount prefix."""
+    route = scope.get("route")
+    if route is None:
+        return UNMATCHED_ROUTE
+    return scope.get("root_path", "") + route.path
+
+
+def observe_password_hash(operation: str, start: float) -> None:
+    PASSWORD_HASH_DURATION.labels(operation).observe(time.perf_counter() - start)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Time every statement executed through the engine."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        start = conn.info["query_start"].pop()
+        verb = statement.lstrip().split(None, 1)[0].upper() if statement else "UNKNOWN"
+        DB_STATEMENT_DURATION.labels(verb).observe(time.perf_counter() - start)
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(context):
+        # drop the start time of the failed statement so the stack stays aligned
+        starts = context.connection.info.get("query_start") if context.connection is not None else None
+        if starts:
+            starts.pop()
+
+
+def metrics_response() -> Response:
+    """Render all metrics, aggregated across workers in multiprocess mode."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
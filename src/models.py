@@ -1,22 +1,54 @@
-from datetime import datetime, timezone
+from datetime import datetime
 
-from sqlalchemy import event
+from sqlalchemy import DDL, FetchedValue, event, func
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.types import DateTime
 
+from src.constants import DB_SCHEMA
+
+# keeps updated_at current for every UPDATE, including raw SQL; an UPDATE
+# that sets updated_at itself (e.g. a backfill) is left alone
+CREATE_SET_UPDATED_AT = DDL(
+    f"CREATE OR REPLACE FUNCTION {DB_SCHEMA}.set_updated_at() RETURNS trigger AS $$ "
+    "BEGIN "
+    "IF NEW.updated_at IS NOT DISTINCT FROM OLD.updated_at THEN "
+    "NEW.updated_at := timezone('utc', now()); "
+    "END IF; "
+    "RETURN NEW; "
+    "END; "
+    "$$ LANGUAGE plpgsql"
+)
+DROP_SET_UPDATED_AT = DDL(f"DROP FUNCTION IF EXISTS {DB_SCHEMA}.set_updated_at()")
+CREATE_UPDATED_AT_TRIGGER = DDL(
+    "CREATE TRIGGER %(table)s_set_updated_at BEFORE UPDATE ON %(fullname)s "
+    f"FOR EACH ROW EXECUTE FUNCTION {DB_SCHEMA}.set_updated_at()"
+)
+
+
+def utc_now():
+    """SQL expression for the current UTC time, as stored in naive DateTime columns."""
+    return func.timezone("utc", func.now())
+
 
 class TimeStampMixin:
-    """Timestamping mixin for created_at and updated_at fields."""
+    """Timestamping mixin for created_at and updated_at fields.
+
+    Both are generated by the database: ``created_at`` by a column default
+    and ``updated_at`` by a ``BEFORE UPDATE`` trigger, so they are correct
+    for ORM, Core bulk and raw SQL statements alike. The trigger is created
+    by the migrations and, for ``cli database init``, along with the table.
+    """
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc).replace(tzinfo=None))
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc).replace(tzinfo=None))
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=utc_now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=utc_now(), server_onupdate=FetchedValue())
 
-    @staticmethod
-    def _updated_at(mapper, connection, target):
-        """Updates the updated_at field to the current UTC time."""
-        target.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    # fetch the server-generated values with RETURNING instead of a lazy load later
+    __mapper_args__ = {"eager_defaults": True}
 
-    @classmethod
-    def __declare_last__(cls):
-        """Registers the before_update event to update the updated_at field."""
-        event.listen(cls, "before_update", cls._updated_at)
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Creates the updated_at trigger (and its function) whenever the table is created."""
+        super().__init_subclass__(**kwargs)
+        if not event.contains(cls.metadata, "before_create", CREATE_SET_UPDATED_AT):
+            event.listen(cls.metadata, "before_create", CREATE_SET_UPDATED_AT)
+            event.listen(cls.metadata, "after_drop", DROP_SET_UPDATED_AT)
+        event.listen(cls.__table__, "after_create", CREATE_UPDATED_AT_TRIGGER)
@@ -1,7 +1,25 @@
 from datetime import datetime
-from typing import ClassVar
+from typing import Annotated, ClassVar
 
-from pydantic import BaseModel, ConfigDict, SecretStr
+from pydantic import BaseModel, ConfigDict, PlainSerializer, SecretStr
+
+
+def serialize_datetime(v: datetime | None) -> str | None:
+    """Render datetimes as UTC ISO 8601 with a literal Z suffix.
+
+    Same output as ``strftime("%Y-%m-%dT%H:%M:%S.%fZ")``, several times faster.
+    """
+    return v.replace(tzinfo=None).isoformat(timespec="microseconds") + "Z" if v else None
+
+
+def serialize_secret(v: SecretStr | None) -> str | None:
+    """Reveal the secret value in JSON output."""
+    return v.get_secret_value() if v else None
+
+
+# Use these instead of bare datetime/SecretStr in response schemas to keep the wire format
+EduDateTime = Annotated[datetime, PlainSerializer(serialize_datetime, return_type=str, when_used="json")]
+EduSecretStr = Annotated[SecretStr, PlainSerializer(serialize_secret, return_type=str, when_used="json")]
 
 
 class EduBase(BaseModel):
@@ -11,9 +29,4 @@ class EduBase(BaseModel):
         validate_assignment=True,
         arbitrary_types_allowed=True,
         str_strip_whitespace=True,
-        json_encoders={
-            # custom output conversion for datetime
-            datetime: lambda v: v.strftime("%Y-%m-%dT%H:%M:%S.%fZ") if v else None,
-            SecretStr: lambda v: v.get_secret_value() if v else None,
-        },
     )
@@ -0,0 +1,142 @@
+"""Production server: pre-forked uvicorn workers sharing one connection budget.
+
+Every worker owns its own connection pools, so the per-process pool settings
+are derived from a global budget before the workers are spawned; N workers
+then never open more than ``DATABASE_CONNECTION_BUDGET`` connections to any
+one database server. The supervisor restarts workers one at a time on SIGHUP
+and drains in-flight requests on SIGTERM/SIGINT.
+"""
+import importlib.util
+import logging
+import os
+import shutil
+import tempfile
+from typing import NamedTuple
+
+import uvicorn
+from prometheus_client import multiprocess
+from uvicorn.supervisors import Multiprocess
+
+logger = logging.getLogger(__name__)
+
+# a request may hold a session while a dependency or background job holds another
+MIN_CONNECTIONS_PER_WORKER = 2
+
+
+class PoolBudget(NamedTuple):
+    pool_size: int
+    max_overflow: int
+
+
+def default_workers() -> int:
+    """CPUs this process may run on, which respects container CPU sets."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def split_connection_budget(budget: int, workers: int) -> PoolBudget:
+    """Divide a connection budget into per-worker pool settings.
+
+    A quarter of each worker's share is kept as overflow so bursts can grow
+    the pool while the steady state holds fewer idle connections. Refuses
+    budgets that leave a worker fewer than ``MIN_CONNECTIONS_PER_WORKER``,
+    where requests would queue for a connection until ``pool_timeout``.
+    """
+    per_worker = budget // workers
+    if per_worker < MIN_CONNECTIONS_PER_WORKER:
+        raise ValueError(
+            f"A budget of {budget} connections gives each of {workers} workers {per_worker}, "
+            f"at least {MIN_CONNECTIONS_PER_WORKER} are needed; raise the budget or use fewer workers"
+        )
+    max_overflow = per_worker // 4
+    return PoolBudget(pool_size=per_worker - max_overflow, max_overflow=max_overflow)
+
+
+def configure_workers(budget: int, workers: int) -> PoolBudget:
+    """Export the per-worker settings; spawned workers read them from the environment."""
+    pool = split_connection_budget(budget, workers)
+    os.environ["DATABASE_POOL_SIZE"] = os.environ["DATABASE_REPLICA_POOL_SIZE"] = str(pool.pool_size)
+    os.environ["DATABASE_MAX_OVERFLOW"] = os.environ["DATABASE_REPLICA_MAX_OVERFLOW"] = str(pool.max_overflow)
+    return pool
+
+
+class WorkerSupervisor(Multiprocess):
+    """uvicorn's multiprocess supervisor, also retiring the metrics of workers that exit.
+
+    A worker replaced after a crash or on SIGHUP leaves its live gauge files
+    in ``PROMETHEUS_MULTIPROC_DIR``; ``mark_process_dead`` removes them so
+    ``livesum`` gauges stop counting the old process.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._known_pids: set[int] = set()
+
+    def keep_subprocess_alive(self) -> None:
+        # runs every loop iteration, after signals (and so SIGHUP restarts) are handled
+        super().keep_subprocess_alive()
+        self.retire_exited_workers()
+
+    def run(self) -> None:
+        super().run()
+        self.retire_exited_workers(stopping=True)
+
+    def retire_exited_workers(self, *, stopping: bool = False) -> None:
+        live = set() if stopping else {process.pid for process in self.processes if process.pid is not None}
+        if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+            for pid in self._known_pids - live:
+                multiprocess.mark_process_dead(pid)
+                logger.debug(f"Removed live metrics of worker {pid}")
+        self._known_pids = live
+
+
+def event_loop() -> str:
+    return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
+
+def http_protocol() -> str:
+    return "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+
+def serve(
+    *,
+    host: str,
+    port: int,
+    workers: int,
+    graceful_timeout: int,
+    keep_alive: int,
+    backlog: int,
+    access_log: bool,
+) -> None:
+    """Run the app with ``workers`` processes; call ``configure_workers`` first."""
+    multiproc_dir = None
+    if workers > 1 and "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        # aggregate /metrics across workers; must be empty at start-up
+        multiproc_dir = os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(prefix="edu-prometheus-")
+
+    config = uvicorn.Config(
+        "src.main:app",
+        host=host,
+        port=port,
+        workers=workers,
+        loop=event_loop(),
+        http=http_protocol(),
+        backlog=backlog,
+        timeout_keep_alive=keep_alive,
+        timeout_graceful_shutdown=graceful_timeout,
+        access_log=access_log,
+        proxy_headers=True,
+    )
+    server = uvicorn.Server(config)
+    try:
+        # what uvicorn.run does, with our supervisor in place of Multiprocess
+        if workers > 1:
+            WorkerSupervisor(config, target=server.run, sockets=[config.bind_socket()]).run()
+        else:
+            server.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if multiproc_dir is not None:
+            shutil.rmtree(multiproc_dir, ignore_errors=True)
@@ -0,0 +1,28 @@
+from fastapi.testclient import TestClient
+
+from src.auth.tokens import create_access_token
+from src.config import Config, settings
+from src.main import app
+
+
+def get_diagnostics(email: str | None = None):
+    cookies = {"access_token": create_access_token(email)} if email else {}
+    return TestClient(app, cookies=cookies).get("/internal/diagnostics")
+
+
+def test_diagnostics_require_admin(monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_EMAILS", ["ops@example.com"])
+
+    assert get_diagnostics().status_code == 401
+    assert get_diagnostics("someone@example.com").status_code == 403
+
+    response = get_diagnostics("ops@example.com")
+    assert response.status_code == 200
+    assert "database_pools" in response.json()
+
+
+def test_nobody_is_admin_by_default(monkeypatch):
+    assert Config.model_fields["ADMIN_EMAILS"].default == []
+    monkeypatch.setattr(settings, "ADMIN_EMAILS", [])
+
+    assert get_diagnostics("admin@edu.com").status_code == 403
@@ -0,0 +1,46 @@
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects import postgresql
+
+from src.auth.models import EduUser
+from src.auth.queries import select_record_by_email
+from src.constants import DB_SCHEMA
+
+# the unique index, or the text_pattern_ops one for prefix search, which serves equality too
+LOWER_EMAIL_INDEXES = {"edu_users_email_lower_key", "edu_users_email_lower_pattern_idx"}
+EMAIL = "seed-4242@example.com"
+
+
+def plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def test_email_lookups_use_the_lower_email_index(run_db):
+    lookups = [
+        select_record_by_email.params(email=EMAIL),
+        select(EduUser).where(func.lower(EduUser.email) == EMAIL),
+    ]
+
+    async def test(session_manager):
+        async with session_manager.session() as db_session:
+            # seeded and analyzed inside the transaction, then rolled back
+            await db_session.execute(
+                text(
+                    f"INSERT INTO {DB_SCHEMA}.edu_users (email, password) "
+                    "SELECT 'Seed-' || g || '@Example.com', '\\\\x00'::bytea "
+                    "FROM generate_series(1, 20000) AS g ON CONFLICT DO NOTHING"
+                )
+            )
+            await db_session.execute(text(f"ANALYZE {DB_SCHEMA}.edu_users"))
+            try:
+                for statement in lookups:
+                    sql = statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+                    plan = (await db_session.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))).scalar_one()[0]["Plan"]
+                    nodes = list(plan_nodes(plan))
+                    assert any(node.get("Index Name") in LOWER_EMAIL_INDEXES for node in nodes), nodes
+                    assert not any(node["Node Type"] == "Seq Scan" for node in nodes), nodes
+            finally:
+                await db_session.rollback()
+
+    run_db(test)
@@ -0,0 +1,48 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# module -> dependencies it must not import; none of them may build the settings
+EAGER_IMPORTS: dict[str, tuple[str, ...]] = {
+    "src.cli": ("asyncpg", "bcrypt", "jose", "sqlalchemy", "pydantic_settings"),
+    "src.database.core": ("asyncpg", "bcrypt", "jose", "fastapi"),
+}
+
+
+def import_in_subprocess(module: str, cwd: Path) -> dict:
+    """Import ``module`` in a fresh interpreter without any configuration available."""
+    code = (
+        f"import json, sys; import {module}; modules = sorted(sys.modules); "
+        "config = sys.modules.get('src.config'); "
+        "built = config.get_settings.cache_info().currsize if config else 0; "
+        "print(json.dumps({'settings_built': built, 'modules': modules}))"
+    )
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if not key.startswith(("DATABASE_", "JWT_"))
+    }
+    # run outside the repo so no .env is picked up
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+        env={**env, "PYTHONPATH": str(ROOT)},
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout)
+
+
+@pytest.mark.parametrize("module", EAGER_IMPORTS)
+def test_import_does_not_load_settings_or_heavy_dependencies(module, tmp_path):
+    report = import_in_subprocess(module, tmp_path)
+
+    assert report["settings_built"] == 0
+    assert sorted(set(EAGER_IMPORTS[module]) & set(report["modules"])) == []
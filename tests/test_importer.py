@@ -0,0 +1,42 @@
+from sqlalchemy import delete, func, select
+
+from src.auth.hashing import check_password, hash_password
+from src.auth.importer import ImportStats, validate_rows, write_batch
+from src.auth.models import EduUser
+
+EMAILS = ["import-test-1@example.com", "import-test-2@example.com"]
+
+
+def test_write_batch_inserts_and_skips_duplicates(run_db):
+    async def test(session_manager):
+        records = [(email, hash_password("Secret123", rounds=4)) for email in EMAILS]
+        try:
+            assert await write_batch(session_manager, records) == 2
+            # emails are unique case-insensitively
+            assert await write_batch(session_manager, [(EMAILS[0].upper(), records[0][1])]) == 0
+
+            async with session_manager.session() as db_session:
+                users = (
+                    await db_session.execute(select(EduUser).where(EduUser.email.in_(EMAILS)).order_by(EduUser.email))
+                ).scalars().all()
+            assert [user.email for user in users] == EMAILS
+            assert check_password("Secret123", users[0].password)
+            assert all(user.created_at is not None for user in users)
+        finally:
+            async with session_manager.connect() as conn:
+                await conn.execute(delete(EduUser).where(func.lower(EduUser.email).in_(EMAILS)))
+
+    run_db(test)
+
+
+def test_validate_rows_rejects_missing_passwords():
+    stats = ImportStats()
+    rows = [
+        {"email": "Import-Test-1@example.com", "password": "Secret123"},
+        {"email": "import-test-2@example.com", "password": ""},
+        {"email": "import-test-3@example.com"},
+        {"email": "not-an-email", "password": "Secret123"},
+    ]
+
+    assert list(validate_rows(rows, stats)) == [("import-test-1@example.com", "Secret123")]
+    assert (stats.read, stats.invalid) == (4, 3)
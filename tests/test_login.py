@@ -0,0 +1,65 @@
+import httpx
+from fastapi.testclient import TestClient
+from sqlalchemy import delete
+
+import src.database.dependencies
+from src.auth import routes, services
+from src.auth.audit import audit_log
+from src.auth.cache import user_cache
+from src.auth.hashing import HashingQueueFull, hash_password
+from src.auth.models import EduUser
+from src.config import settings
+from src.main import app
+
+EMAIL = "login-test@example.com"
+PASSWORD = "Secret123"
+
+
+def test_login_needs_a_single_connection(run_db, monkeypatch):
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 4)
+
+    async def test(session_manager):
+        monkeypatch.setattr(src.database.dependencies, "get_session_manager", lambda: session_manager)
+        monkeypatch.setattr(services, "get_session_manager", lambda: session_manager)
+        async with session_manager.session() as db_session:
+            db_session.add(EduUser(email=EMAIL, password=hash_password(PASSWORD, rounds=4)))
+            await db_session.commit()
+        user_cache.clear()
+        try:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.post(f"{settings.API_V1_STR}/auth/login", json={"email": EMAIL, "password": PASSWORD})
+
+            assert response.status_code == 200, response.text
+            access_cookie = next(header for header in response.headers.get_list("set-cookie") if header.startswith("access_token="))
+            assert f"Max-Age={settings.JWT_EXP}" in access_cookie
+        finally:
+            user_cache.clear()
+            async with session_manager.connect() as conn:
+                await conn.execute(delete(EduUser).where(EduUser.email == EMAIL))
+
+    # with one connection and no overflow, a login holding two would time out
+    run_db(test, engine_kwargs={"pool_size": 1, "max_overflow": 0, "pool_timeout": 2})
+
+
+def test_login_shed_by_the_hashing_queue_is_audited(monkeypatch):
+    async def get_record_by_email(*, email):
+        return EduUser(id=1, email=email, password=b"hash")
+
+    async def verify_password_async(password, hashed):
+        raise HashingQueueFull()
+
+    events = []
+
+    async def record(event, **fields):
+        events.append((event, fields["email"], fields["success"]))
+
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", False)
+    monkeypatch.setattr(routes, "get_record_by_email", get_record_by_email)
+    monkeypatch.setattr(routes, "verify_password_async", verify_password_async)
+    monkeypatch.setattr(audit_log, "record", record)
+
+    response = TestClient(app).post(f"{settings.API_V1_STR}/auth/login", json={"email": EMAIL, "password": PASSWORD})
+
+    assert response.status_code == 503
+    assert events == [("login", EMAIL, False)]
@@ -0,0 +1,25 @@
+from sqlalchemy import text
+
+from src.metrics import DB_POOL_CHECKED_OUT, DB_POOL_OVERFLOW
+
+
+def gauges() -> tuple[float, float]:
+    return DB_POOL_CHECKED_OUT.labels("primary")._value.get(), DB_POOL_OVERFLOW.labels("primary")._value.get()
+
+
+def test_gauges_drop_back_to_zero_after_checkin(run_db):
+    async def test(session_manager):
+        async with session_manager.connect() as first, session_manager.connect() as second:
+            await first.execute(text("SELECT 1"))
+            await second.execute(text("SELECT 1"))
+            assert gauges() == (2, 1)
+        # the overflow connection is closed as the queue is full again
+        assert gauges() == (0, 0)
+
+        async with session_manager.session() as db_session:
+            await db_session.execute(text("SELECT 1"))
+            assert gauges() == (1, 0)
+        assert gauges() == (0, 0)
+        assert session_manager.pool_status()["primary"]["checked_out"] == 0
+
+    run_db(test, engine_kwargs={"pool_size": 1, "max_overflow": 1})
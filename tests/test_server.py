@@ -0,0 +1,13 @@
+import pytest
+
+from src.server import PoolBudget, split_connection_budget
+
+
+def test_split_connection_budget_keeps_a_quarter_as_overflow():
+    assert split_connection_budget(64, 4) == PoolBudget(pool_size=12, max_overflow=4)
+    assert split_connection_budget(5, 2) == PoolBudget(pool_size=2, max_overflow=0)
+
+
+def test_split_connection_budget_refuses_fewer_than_two_connections_per_worker():
+    with pytest.raises(ValueError, match="at least 2"):
+        split_connection_budget(7, 4)
@@ -0,0 +1,65 @@
+import asyncio
+import time
+
+import pytest
+
+from src.auth import throttling
+from src.auth.throttling import MemoryRateLimitBackend
+
+WINDOW = 60
+LIMIT = 10
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A settable ``time.time`` for the limiter, starting on a window boundary."""
+    now = [100 * WINDOW]
+    monkeypatch.setattr(throttling.time, "time", lambda: now[0])
+    return now
+
+
+def hit(limiter: MemoryRateLimitBackend, key: str) -> float:
+    return asyncio.run(limiter.hit(key, limit=LIMIT, window=WINDOW))
+
+
+def test_limit_and_retry_after(clock):
+    limiter = MemoryRateLimitBackend(max_keys=10)
+
+    assert [hit(limiter, "a") for _ in range(LIMIT)] == [0] * LIMIT
+    assert hit(limiter, "a") == WINDOW
+
+    # a quarter into the next window, 7.5 of the previous 10 hits still count
+    clock[0] += WINDOW + 15
+    assert [hit(limiter, "a") for _ in range(3)] == [0] * 3
+    assert hit(limiter, "a") == pytest.approx(3)  # until only 7 of the previous ones count
+    clock[0] += 3.5
+    assert hit(limiter, "a") == 0
+
+
+def test_full_limiter_evicts_least_recently_hit_key(clock):
+    limiter = MemoryRateLimitBackend(max_keys=3)
+    for key in ["a", "b", "c"]:
+        hit(limiter, key)
+    hit(limiter, "a")
+
+    hit(limiter, "d")
+    assert len(limiter) == 3
+    assert set(limiter._counters) == {"a", "c", "d"}
+
+
+def test_new_keys_stay_cheap_at_capacity(clock):
+    max_keys = 20_000
+    limiter = MemoryRateLimitBackend(max_keys=max_keys)
+
+    async def fill(prefix: str, count: int) -> None:
+        for i in range(count):
+            assert await limiter.hit(f"{prefix}{i}", limit=LIMIT, window=WINDOW) == 0
+
+    asyncio.run(fill("old", max_keys))
+    started = time.perf_counter()
+    asyncio.run(fill("new", 5_000))
+    elapsed = time.perf_counter() - started
+
+    assert len(limiter) == max_keys
+    # scanning every key for each new one would take seconds here
+    assert elapsed < 0.5
@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from sqlalchemy import delete, insert, select, text, update
+
+from src.auth.models import EduUser
+from src.models import utc_now
+
+EMAIL = "timestamps-test@example.com"
+BACKDATED = datetime(2000, 1, 1)
+
+
+def test_updated_at_is_set_by_the_database_for_any_update(run_db):
+    async def test(session_manager):
+        async with session_manager.connect() as conn:
+            await conn.execute(insert(EduUser).values(email=EMAIL, password=b"x"))
+        try:
+            statements = [
+                update(EduUser).where(EduUser.email == EMAIL).values(password=b"y"),
+                text("UPDATE edu_core.edu_users SET password = 'z'::bytea WHERE email = :email").bindparams(email=EMAIL),
+            ]
+            for statement in statements:
+                async with session_manager.connect() as conn:
+                    # backdate it; an explicit value is kept as given
+                    await conn.execute(update(EduUser).where(EduUser.email == EMAIL).values(updated_at=BACKDATED))
+                    assert await conn.scalar(select(EduUser.updated_at).where(EduUser.email == EMAIL)) == BACKDATED
+
+                    await conn.execute(statement)
+                    updated_at = await conn.scalar(select(EduUser.updated_at).where(EduUser.email == EMAIL))
+                    # now() is the transaction start, so this is exactly the trigger's value
+                    assert updated_at == await conn.scalar(select(utc_now()))
+        finally:
+            async with session_manager.connect() as conn:
+                await conn.execute(delete(EduUser).where(EduUser.email == EMAIL))
+
+    run_db(test)
@@ -0,0 +1,86 @@
+import asyncio
+import contextlib
+
+from sqlalchemy import delete
+
+from src.auth import services
+from src.auth.cache import UserCache, user_cache
+from src.auth.hashing import hash_password
+from src.auth.models import EduUser, UserRecord
+
+EMAIL = "cache-test@example.com"
+
+
+def test_concurrent_misses_share_one_load():
+    async def test():
+        cache = UserCache(maxsize=10, ttl=30)
+        loads = 0
+
+        async def loader():
+            nonlocal loads
+            loads += 1
+            await asyncio.sleep(0.05)
+            return UserRecord(1, EMAIL, b"hash")
+
+        first = asyncio.create_task(cache.get(EMAIL, loader))
+        others = [asyncio.create_task(cache.get(EMAIL, loader)) for _ in range(3)]
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert [record.id for record in await asyncio.gather(*others)] == [1, 1, 1]
+        assert loads == 1
+        assert await cache.get(EMAIL, loader) == UserRecord(1, EMAIL, b"hash")
+        assert loads == 1
+
+    asyncio.run(test())
+
+
+def test_cancelled_caller_does_not_break_shared_load(run_db, monkeypatch):
+    async def test(session_manager):
+        monkeypatch.setattr(services, "get_session_manager", lambda: session_manager)
+        user_cache.clear()
+        async with session_manager.session() as db_session:
+            db_session.add(EduUser(email=EMAIL, password=hash_password("Secret123", rounds=4)))
+            await db_session.commit()
+        try:
+            first = asyncio.create_task(services.get_record_by_email(email=EMAIL))
+            second = asyncio.create_task(services.get_record_by_email(email=EMAIL.upper()))
+            await asyncio.sleep(0)
+            first.cancel()
+
+            record = await second
+            assert record is not None and record.email == EMAIL
+        finally:
+            user_cache.clear()
+            async with session_manager.connect() as conn:
+                await conn.execute(delete(EduUser).where(EduUser.email == EMAIL))
+
+    run_db(test)
+
+
+class FakeSessionManager:
+    """Stands in for a primary plus a replica that lags behind it."""
+
+    has_replicas = True
+
+    @contextlib.asynccontextmanager
+    async def read_session(self):
+        yield "replica"
+
+    @contextlib.asynccontextmanager
+    async def session(self):
+        yield "primary"
+
+
+def test_replica_miss_falls_back_to_primary(monkeypatch):
+    async def fetch_record_by_email(*, db_session, email):
+        return UserRecord(1, email, b"hash") if db_session == "primary" else None
+
+    monkeypatch.setattr(services, "get_session_manager", FakeSessionManager)
+    monkeypatch.setattr(services, "fetch_record_by_email", fetch_record_by_email)
+    user_cache.clear()
+    try:
+        record = asyncio.run(services.get_record_by_email(email=EMAIL))
+    finally:
+        user_cache.clear()
+    assert record == UserRecord(1, EMAIL, b"hash")
@@ -0,0 +1,53 @@
+from datetime import datetime
+
+import httpx
+from sqlalchemy import delete, insert
+
+import src.database.dependencies
+from src.auth.models import EduUser
+from src.auth.tokens import create_access_token
+from src.config import settings
+from src.main import app
+
+ADMIN = "listing-admin@example.com"
+PREFIX = "listing-test-"
+EMAILS = [f"{PREFIX}{i}@example.com" for i in range(5)]
+
+
+def test_cursor_pagination_round_trip(run_db, monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_EMAILS", [ADMIN])
+
+    async def test(session_manager):
+        monkeypatch.setattr(src.database.dependencies, "get_session_manager", lambda: session_manager)
+        async with session_manager.connect() as conn:
+            # all created at once, so only the id orders them
+            await conn.execute(
+                insert(EduUser), [{"email": email, "password": b"x", "created_at": datetime(2000, 1, 1)} for email in EMAILS]
+            )
+        try:
+            transport = httpx.ASGITransport(app=app)
+            cookies = {"access_token": create_access_token(ADMIN)}
+            async with httpx.AsyncClient(transport=transport, base_url="http://test", cookies=cookies) as client:
+
+                async def get_page(**params) -> httpx.Response:
+                    return await client.get(f"{settings.API_V1_STR}/auth/users", params={"email_prefix": PREFIX, **params})
+
+                pages, cursor = [], None
+                while True:
+                    response = await get_page(limit=2, **({"cursor": cursor} if cursor else {}))
+                    assert response.status_code == 200, response.text
+                    body = response.json()
+                    pages.append([item["email"] for item in body["items"]])
+                    cursor = body["next_cursor"]
+                    if cursor is None:
+                        break
+
+                # newest first, ties broken by the higher id, no row repeated or skipped
+                assert pages == [EMAILS[4:2:-1], EMAILS[2:0:-1], EMAILS[:1]]
+
+                assert (await get_page(cursor="not-a-cursor")).status_code == 400
+        finally:
+            async with session_manager.connect() as conn:
+                await conn.execute(delete(EduUser).where(EduUser.email.in_(EMAILS)))
+
+    run_db(test)